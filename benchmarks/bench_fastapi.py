@@ -0,0 +1,47 @@
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import Depends, FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from benchmarks.conftest import (
+    RELATIONSHIP_QUERY,
+    RELATIONSHIPS,
+    Book,
+    flat_query,
+)  # noqa: E402
+from ormparams.fastapi_ext import OrmParamsFastAPI  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def client():
+    app = FastAPI()
+    ormp = OrmParamsFastAPI()
+    ormp.init_app(app)
+
+    @app.get("/params")
+    def params(parsed=Depends(ormp.get_params(Book))):
+        return len(parsed)
+
+    @app.get("/query")
+    def query(stmt=Depends(ormp.get_query(Book, allowed_relationships=RELATIONSHIPS))):
+        return stmt is not None
+
+    @app.get("/baseline")
+    def baseline():
+        return 0
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.parametrize("endpoint", ["/baseline", "/params", "/query"])
+@pytest.mark.parametrize(
+    "query", [flat_query(10), RELATIONSHIP_QUERY], ids=["flat-10", "relationships"]
+)
+def bench_dependency(benchmark, client, endpoint, query):
+    url = f"{endpoint}?{query}"
+    assert client.get(url).status_code == 200
+
+    benchmark(client.get, url)
@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy.dialects import sqlite
+
+from benchmarks.conftest import (
+    RELATIONSHIP_QUERY,
+    RELATIONSHIPS,
+    Author,
+    Book,
+    flat_query,
+)
+from ormparams.core.filter import OrmParamsFilter
+
+CASES = {
+    "flat-10": (flat_query(10), None),
+    "flat-100": (flat_query(100), None),
+    "relationships": (RELATIONSHIP_QUERY, RELATIONSHIPS),
+}
+
+
+@pytest.fixture(params=list(CASES))
+def case(request, parser):
+    query, relationships = CASES[request.param]
+    return parser.parse(query), relationships
+
+
+def bench_filter_cached_plan(benchmark, policy, case):
+    parsed, relationships = case
+    f = OrmParamsFilter(policy, model=Book)
+    f.filter(parsed=parsed, allowed_relationships=relationships)
+
+    benchmark(f.filter, parsed=parsed, allowed_relationships=relationships)
+
+
+def bench_filter_cold_plan(benchmark, policy, case):
+    parsed, relationships = case
+    f = OrmParamsFilter(policy, model=Book)
+
+    def run():
+        policy.PLAN_CACHE.clear()
+        return f.filter(parsed=parsed, allowed_relationships=relationships)
+
+    benchmark(run)
+
+
+def bench_filter_with_params(benchmark, policy, case):
+    parsed, relationships = case
+    f = OrmParamsFilter(policy, model=Book)
+    f.filter_with_params(parsed=parsed, allowed_relationships=relationships)
+
+    benchmark(f.filter_with_params, parsed=parsed, allowed_relationships=relationships)
+
+
+def bench_sqlite_compile(benchmark, policy, case):
+    parsed, relationships = case
+    query = OrmParamsFilter(policy, model=Book).filter(
+        parsed=parsed, allowed_relationships=relationships
+    )
+    dialect = sqlite.dialect()
+
+    benchmark(lambda: str(query.compile(dialect=dialect)))
+
+
+@pytest.mark.parametrize("strategy", ["join", "exists", "in-subquery"])
+def bench_relationship_strategy_compile(benchmark, policy, parser, strategy):
+    policy.RELATIONSHIP_STRATEGY = strategy
+    parsed = parser.parse("name__startswith=A&books.c1__gt=1&books.reviews.score=5")
+    f = OrmParamsFilter(policy, model=Author)
+    dialect = sqlite.dialect()
+
+    def run():
+        query = f.filter(parsed=parsed, allowed_relationships=["books", "reviews"])
+        return str(query.compile(dialect=dialect))
+
+    benchmark(run)
@@ -0,0 +1,35 @@
+"""Build + compile time of long logic chains."""
+
+import pytest
+from sqlalchemy import and_, column, or_, select, table
+from sqlalchemy.dialects import sqlite
+
+from ormparams.core.plan import combine
+
+t = table("t", column("a"))
+
+
+def pairwise(exprs, logic):
+    combined = exprs[0]
+    for unit, next_expr in zip(logic, exprs[1:]):
+        combined = (
+            and_(combined, next_expr) if unit == "AND" else or_(combined, next_expr)
+        )
+    return combined
+
+
+@pytest.mark.parametrize("n_params", [10, 100, 1000])
+@pytest.mark.parametrize("mode", ["AND", "mixed"])
+@pytest.mark.parametrize("strategy", [pairwise, combine], ids=["pairwise", "flat"])
+def test_compile_logic_chain(benchmark, strategy, mode, n_params):
+    exprs = [t.c.a == i for i in range(n_params)]
+    if mode == "AND":
+        logic = ["AND"] * (n_params - 1)
+    else:
+        logic = ["AND" if (i // 10) % 2 else "OR" for i in range(n_params - 1)]
+
+    def run():
+        stmt = select(t).where(strategy(exprs, logic))
+        return str(stmt.compile(dialect=sqlite.dialect()))
+
+    benchmark(run)
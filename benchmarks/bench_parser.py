@@ -0,0 +1,28 @@
+import pytest
+
+from benchmarks.conftest import flat_query
+from ormparams.core.tokenizer import iter_query_string
+
+
+@pytest.mark.parametrize("n_params", [1, 10, 100, 500])
+def bench_parse(benchmark, parser, n_params):
+    query = flat_query(n_params)
+    result = benchmark(parser.parse, query)
+    assert sum(len(field.params) for field in result.values()) == n_params
+
+
+@pytest.mark.parametrize("n_params", [1, 10, 100, 500])
+def bench_parse_items(benchmark, parser, n_params):
+    items = list(iter_query_string(flat_query(n_params)))
+    benchmark(parser.parse_items, items)
+
+
+@pytest.mark.parametrize("n_params", [1, 100])
+def bench_parse_without_key_cache(benchmark, policy, parser, n_params):
+    query = flat_query(n_params)
+
+    def run():
+        policy.KEY_CACHE.clear()
+        return parser.parse(query)
+
+    benchmark(run)
@@ -0,0 +1,77 @@
+"""
+Benchmarks of the hot path: parsing, plan compilation/filtering, SQL compile
+and the FastAPI dependency.
+
+    python -m pytest benchmarks
+    python -m pytest benchmarks --benchmark-compare            # against the last saved run
+    python -m pytest benchmarks --benchmark-compare=0001 --benchmark-compare-fail=median:10%
+
+Every run is saved under .benchmarks/ (pytest-benchmark storage), so runs of
+different versions can be compared with `pytest-benchmark compare`.
+"""
+
+import logging
+
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlalchemy.orm import declarative_base, relationship
+
+from ormparams.core.mixin import OrmParamsMixin
+from ormparams.core.parser import OrmParamsParser
+from ormparams.core.policy import OrmParamsPolicy
+
+Base = declarative_base()
+
+N_COLUMNS = 20
+
+
+class Author(Base, OrmParamsMixin):
+    __tablename__ = "authors"
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    books = relationship("Book", back_populates="author")
+
+
+class Book(Base, OrmParamsMixin):
+    __tablename__ = "books"
+    id = Column(Integer, primary_key=True)
+    author_id = Column(Integer, ForeignKey("authors.id"))
+    author = relationship("Author", back_populates="books")
+    reviews = relationship("Review", back_populates="book")
+
+    locals().update({f"c{i}": Column(Integer) for i in range(N_COLUMNS)})
+
+
+class Review(Base, OrmParamsMixin):
+    __tablename__ = "reviews"
+    id = Column(Integer, primary_key=True)
+    book_id = Column(Integer, ForeignKey("books.id"))
+    score = Column(Integer)
+    book = relationship("Book", back_populates="reviews")
+
+
+def flat_query(n_params: int) -> str:
+    """n_params filters spread over Book columns and operators."""
+    ops = ("exact", "gt", "lt", "in")
+    return "&".join(
+        (
+            f"c{i % N_COLUMNS}__{ops[i % len(ops)]}={i},{i + 1}"
+            if ops[i % len(ops)] == "in"
+            else f"c{i % N_COLUMNS}__{ops[i % len(ops)]}={i}"
+        )
+        for i in range(n_params)
+    )
+
+
+RELATIONSHIP_QUERY = "c1__gt=1&author.name__startswith=A&reviews.score__ge=3"
+RELATIONSHIPS = ["author", "reviews"]
+
+
+@pytest.fixture
+def policy():
+    return OrmParamsPolicy(LOGGER=logging.getLogger("ormparams-bench"))
+
+
+@pytest.fixture
+def parser(policy):
+    return OrmParamsParser(policy)
@@ -29,13 +29,8 @@ def get_db():
 @app.get("/parents", response_model=list[ParentReadSchema])
 async def get_parents(
     db: Session = Depends(get_db),
-    params=Depends(ormparams.get_params([Parent, Child], include=["children"])),
+    query=Depends(ormparams.get_query(Parent, allowed_relationships=["children"])),
 ):
-    query = OrmParamsFilter(
-        ormparams.policy,
-        model=Parent,
-        parsed=params,
-    ).filter(allowed_relationships=["children"])
     return db.execute(query).scalars().all()
 
 
@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+from typing import Any, FrozenSet, Mapping, Optional, Sequence, Tuple, Union
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import inspect
+
+AccessList = Optional[Union[str, Sequence[str]]]
+
+_ACCESS_ATTRIBUTES = (
+    "ORMP_ALLOWED_FIELDS",
+    "ORMP_EXCLUDED_FIELDS",
+    "ORMP_ALLOWED_OPERATIONS",
+    "ORMP_EXCLUDED_OPERATIONS",
+)
+
+_registry: "WeakKeyDictionary[type, ModelAccessIndex]" = WeakKeyDictionary()
+
+
+def _names(value: AccessList) -> Optional[FrozenSet[str]]:
+    """None means "everything": "*", ["*"] or not given."""
+    if isinstance(value, str):
+        value = [value]
+    if value is None or list(value) == ["*"]:
+        return None
+    return frozenset(value)
+
+
+@dataclass(frozen=True)
+class ModelAccessIndex:
+    """
+    Access rules of one mapped class, resolved once.
+
+    [ FIELDS ]:
+        - allowed_fields / allowed_operations: frozenset, or None for "*"
+        - excluded_fields / excluded_operations: frozenset
+        - columns: attribute name -> mapped attribute (columns, relationships, hybrids)
+        - primary_key: attribute names of the primary key columns
+
+    [ NOTES ]:
+        - Model attributes ORMP_* win; filter() arguments are only fallbacks
+          for models that do not declare them (e.g. models without the mixin).
+        - Every check is a frozenset membership test.
+    """
+
+    model: Any
+    allowed_fields: Optional[FrozenSet[str]]
+    excluded_fields: FrozenSet[str]
+    allowed_operations: Optional[FrozenSet[str]]
+    excluded_operations: FrozenSet[str]
+    columns: Mapping[str, Any]
+    primary_key: Tuple[str, ...] = ()
+
+    @classmethod
+    def build(
+        cls,
+        model: Any,
+        allowed_fields: AccessList = None,
+        excluded_fields: AccessList = None,
+        allowed_operations: AccessList = None,
+        excluded_operations: AccessList = None,
+    ) -> "ModelAccessIndex":
+        mapper = inspect(model)
+        return cls(
+            model=model,
+            allowed_fields=_names(
+                getattr(model, "ORMP_ALLOWED_FIELDS", allowed_fields)
+            ),
+            excluded_fields=_names(
+                getattr(model, "ORMP_EXCLUDED_FIELDS", excluded_fields) or []
+            )
+            or frozenset(),
+            allowed_operations=_names(
+                getattr(model, "ORMP_ALLOWED_OPERATIONS", allowed_operations)
+            ),
+            excluded_operations=_names(
+                getattr(model, "ORMP_EXCLUDED_OPERATIONS", excluded_operations) or []
+            )
+            or frozenset(),
+            columns={
+                key: getattr(model, key) for key in mapper.all_orm_descriptors.keys()
+            },
+            primary_key=tuple(
+                mapper.get_property_by_column(column).key
+                for column in mapper.primary_key
+            ),
+        )
+
+    def allows_field(self, field_name: str) -> bool:
+        return (
+            self.allowed_fields is None or field_name in self.allowed_fields
+        ) and field_name not in self.excluded_fields
+
+    def allows_operation(self, operation: str) -> bool:
+        return (
+            self.allowed_operations is None or operation in self.allowed_operations
+        ) and operation not in self.excluded_operations
+
+    def allows(self, field_name: str, operation: str) -> bool:
+        return self.allows_field(field_name) and self.allows_operation(operation)
+
+    def column(self, field_name: str) -> Optional[Any]:
+        return self.columns.get(field_name)
+
+
+def get_access_index(
+    model: Any,
+    allowed_fields: AccessList = None,
+    excluded_fields: AccessList = None,
+    allowed_operations: AccessList = None,
+    excluded_operations: AccessList = None,
+) -> ModelAccessIndex:
+    """
+    Return the access index of `model`.
+
+    Indexes of models declaring every ORMP_* attribute (OrmParamsMixin) are
+    built once and kept per class. Other models depend on the fallbacks,
+    so their index is built for the given arguments.
+    """
+    if not all(hasattr(model, attr) for attr in _ACCESS_ATTRIBUTES):
+        return ModelAccessIndex.build(
+            model,
+            allowed_fields,
+            excluded_fields,
+            allowed_operations,
+            excluded_operations,
+        )
+
+    index = _registry.get(model)
+    if index is None:
+        index = _registry[model] = ModelAccessIndex.build(model)
+    return index
+
+
+def register_access_index(model: Any) -> ModelAccessIndex:
+    """(Re)build and store the index of `model`; called once the mapper is configured."""
+    index = _registry[model] = ModelAccessIndex.build(model)
+    return index
+
+
+def clear_access_indexes() -> None:
+    _registry.clear()
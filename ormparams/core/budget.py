@@ -0,0 +1,97 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+
+from ormparams.core.exceptions import ExceptionWrapper
+
+if TYPE_CHECKING:
+    from ormparams.core.plan import FilterPlan
+
+DEFAULT_OPERATOR_COSTS: Mapping[str, float] = {
+    "exact": 1,
+    "gt": 1,
+    "ge": 1,
+    "lt": 1,
+    "le": 1,
+    "in": 2,
+    "startswith": 2,
+    "contains": 5,
+    "endswith": 5,
+}
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    """
+    Complexity limits of one request, set as OrmParamsPolicy.BUDGET.
+    Every limit is optional (None = unlimited).
+
+    [ FIELDS ]:
+        - max_params: filter params of the request
+        - max_depth: relationships of one key ("a.b.c.name" -> 3)
+        - max_joins: distinct relationship hops (joins and subqueries)
+        - max_in_size: items of one list value (e.g. "in")
+        - max_cost: sum of operator_costs over every operator
+        - operator_costs: cost per suffix, default_cost for unknown ones
+
+    [ FLOW ]:
+        - parser: max_params and max_depth while tokenizing, so a huge
+          query string is rejected before it is fully parsed
+        - filter, before anything is joined or built:
+            plan -> max_params, max_depth, max_joins, max_cost
+            serialized values -> max_in_size
+
+    [ NOTES ]:
+        - Violations raise QueryBudgetExceededError (ExceptionWrapper.budget_exceeded).
+    """
+
+    max_params: Optional[int] = None
+    max_depth: Optional[int] = None
+    max_joins: Optional[int] = None
+    max_in_size: Optional[int] = None
+    max_cost: Optional[float] = None
+    operator_costs: Mapping[str, float] = field(
+        default_factory=lambda: dict(DEFAULT_OPERATOR_COSTS)
+    )
+    default_cost: float = 1
+
+    def check_param(self, n_params: int, depth: int, wrapper: ExceptionWrapper) -> None:
+        """Check the n-th parsed param and its relationship depth."""
+        if self.max_params is not None and n_params > self.max_params:
+            wrapper.budget_exceeded(f"more than {self.max_params} params")
+        if self.max_depth is not None and depth > self.max_depth:
+            wrapper.budget_exceeded(
+                f"relationship depth {depth} exceeds {self.max_depth}"
+            )
+
+    def cost(self, plan: "FilterPlan") -> float:
+        costs = self.operator_costs
+        return sum(costs.get(op.operator, self.default_cost) for op in plan.operators)
+
+    def check_plan(self, plan: "FilterPlan", wrapper: ExceptionWrapper) -> None:
+        if self.max_params is not None and plan.param_count > self.max_params:
+            wrapper.budget_exceeded(
+                f"{plan.param_count} params exceed {self.max_params}"
+            )
+        if self.max_depth is not None and plan.max_depth > self.max_depth:
+            wrapper.budget_exceeded(
+                f"relationship depth {plan.max_depth} exceeds {self.max_depth}"
+            )
+        if self.max_joins is not None and plan.relationship_hops > self.max_joins:
+            wrapper.budget_exceeded(
+                f"{plan.relationship_hops} relationship joins exceed {self.max_joins}"
+            )
+        if self.max_cost is not None:
+            cost = self.cost(plan)
+            if cost > self.max_cost:
+                wrapper.budget_exceeded(f"cost {cost:g} exceeds {self.max_cost:g}")
+
+    def check_values(
+        self, values: Mapping[str, Any], wrapper: ExceptionWrapper
+    ) -> None:
+        if self.max_in_size is None:
+            return
+        for value in values.values():
+            if isinstance(value, (list, tuple)) and len(value) > self.max_in_size:
+                wrapper.budget_exceeded(
+                    f"list of {len(value)} items exceeds {self.max_in_size}"
+                )
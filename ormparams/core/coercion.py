@@ -0,0 +1,95 @@
+import datetime
+import enum
+import uuid
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional
+
+Coercer = Callable[[Any], Any]
+
+_TRUE = frozenset({"true", "1", "yes", "on"})
+_FALSE = frozenset({"false", "0", "no", "off"})
+
+
+def _to_bool(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in _TRUE:
+        return True
+    if lowered in _FALSE:
+        return False
+    raise ValueError(f"'{value}' is not a boolean")
+
+
+def _to_datetime(value: str) -> datetime.datetime:
+    # "Z" suffix is not accepted by fromisoformat before python 3.11
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+_PARSERS: Dict[type, Coercer] = {
+    bool: _to_bool,
+    int: int,
+    float: float,
+    Decimal: Decimal,
+    uuid.UUID: uuid.UUID,
+    datetime.datetime: _to_datetime,
+    datetime.date: datetime.date.fromisoformat,
+    datetime.time: datetime.time.fromisoformat,
+}
+
+_coercers: Dict[Any, Optional[Coercer]] = {}
+
+
+def _enum_parser(enum_cls: type) -> Coercer:
+    def parse(value: str) -> Any:
+        try:
+            return enum_cls[value]  # type: ignore[index]
+        except KeyError:
+            return enum_cls(value)
+
+    return parse
+
+
+def _make_coercer(python_type: type) -> Optional[Coercer]:
+    if issubclass(python_type, enum.Enum):
+        parse = _enum_parser(python_type)
+    else:
+        parse = _PARSERS.get(python_type)  # type: ignore[assignment]
+        if parse is None:
+            return None
+
+    def coerce(value: Any) -> Any:
+        if isinstance(value, str):
+            return parse(value)
+        if isinstance(value, (list, tuple)):
+            return [parse(v) if isinstance(v, str) else v for v in value]
+        return value
+
+    return coerce
+
+
+def coercer_for(column: Any) -> Optional[Coercer]:
+    """
+    Coercer converting raw strings into the python type of `column`.
+
+    [ NOTES ]:
+        - Built once per column from column.type.python_type.
+        - Lists (e.g. from the "in" serializer) are converted element-wise.
+        - Values that are not strings pass through untouched.
+        - None for string columns and types without a known parser.
+    """
+    try:
+        return _coercers[column]
+    except KeyError:
+        pass
+
+    try:
+        python_type = column.type.python_type
+    except (AttributeError, NotImplementedError):
+        python_type = None
+
+    coercer = (
+        _make_coercer(python_type)
+        if isinstance(python_type, type) and python_type is not str
+        else None
+    )
+    _coercers[column] = coercer
+    return coercer
@@ -0,0 +1,53 @@
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Select
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import CompileError, DBAPIError
+
+
+def planner_rows(plan: Dict[str, Any]) -> Optional[int]:
+    """
+    Estimated number of counted rows from a PostgreSQL EXPLAIN (FORMAT JSON) plan.
+    The count aggregate itself returns one row, so its input node is used.
+    """
+    node = plan.get("Plan", plan)
+    while node.get("Node Type") == "Aggregate" and node.get("Plans"):
+        node = node["Plans"][0]
+    rows = node.get("Plan Rows")
+    return int(rows) if rows is not None else None
+
+
+def estimate_count(connection: Connection, count_stmt: Select[Any]) -> Optional[int]:
+    """
+    Planner estimate of `count_stmt`, or None where it is not available.
+
+    [ NOTES ]:
+        - PostgreSQL only: EXPLAIN (FORMAT JSON), no rows are read.
+        - Values are rendered inline (EXPLAIN does not take bind parameters);
+          statements that can not be rendered that way return None.
+        - Runs in a SAVEPOINT: a failed EXPLAIN would otherwise abort the
+          caller's transaction, including the exact count that follows.
+    """
+    if connection.dialect.name != "postgresql":
+        return None
+
+    try:
+        sql = str(
+            count_stmt.compile(
+                dialect=connection.dialect, compile_kwargs={"literal_binds": True}
+            )
+        )
+    except CompileError:
+        return None
+
+    try:
+        with connection.begin_nested():
+            explain = connection.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {sql}"
+            ).scalar()
+    except DBAPIError:
+        return None
+
+    if isinstance(explain, list) and explain:
+        return planner_rows(explain[0])
+    return None
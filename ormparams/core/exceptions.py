@@ -1,10 +1,17 @@
 from logging import Logger
-from typing import Callable
+from typing import Any, Callable, List, Optional, Tuple
 
 from ormparams.core.types import PolicyReaction
+from ormparams.core.violations import ViolationAggregator, ViolationKey
 
 
 class ExceptionWrapper:
+    def __init__(self, violations: Optional[ViolationAggregator] = None) -> None:
+        # counters of the "aggregate" reaction
+        self.violations = (
+            violations if violations is not None else ViolationAggregator()
+        )
+
     def missing_logger(self) -> None:
         raise LoggerMissingError("Logger is missing")
 
@@ -27,12 +34,32 @@ class ExceptionWrapper:
             f"Relationships are nesseccary to be providen in allowed_relationships. \n Please, provide {relationship} in allowed_relationships"
         )
 
+    def unindexed_sort(self, field: str) -> None:
+        raise UnindexedSortError(
+            f"Sorting by '{field}' is not allowed, the field is not indexed."
+        )
+
+    def unindexed_operator(self, field: str, operation: str) -> None:
+        raise UnindexedOperatorError(
+            f"The operation '{operation}' on '{field}' can not use an index."
+        )
+
+    def budget_exceeded(self, reason: str) -> None:
+        raise QueryBudgetExceededError(f"Query is too complex: {reason}.")
+
+    def invalid_values(self, errors: List[Tuple[str, Any, str]]) -> None:
+        details = "; ".join(
+            f"{key}={value!r}: {reason}" for key, value, reason in errors
+        )
+        raise InvalidValueError(f"Invalid values: {details}", errors)
+
     def reactor(
         self,
         rule: PolicyReaction,
         logger: Callable[[], Logger],
         func: Callable,
         *args,
+        violation_key: Optional[ViolationKey] = None,
         **kwargs,
     ) -> None:
         """
@@ -40,9 +67,15 @@ class ExceptionWrapper:
             - "ignore": do nothing
             - "warn": log a warning if exception occurs
             - "error": raise the exception normally
+            - "aggregate": count `violation_key` in self.violations without
+              calling `func`; summaries are logged at most once per interval
         """
         if rule == "ignore":
             return
+        elif rule == "aggregate":
+            if violation_key is None:
+                violation_key = (str(args[0]) if args else "", "", func.__name__)
+            self.violations.record(violation_key, logger)
         elif rule == "warn":
             logger = logger()
             try:
@@ -75,3 +108,23 @@ class ExcludedFieldError(Exception):
 
 class NotAllowedRelationshioError(Exception):
     """When field is not alllowed to be operated"""
+
+
+class UnindexedSortError(Exception):
+    """When a sort field is not backed by an index (OrmParamsPolicy.SORT_REQUIRES_INDEX)"""
+
+
+class UnindexedOperatorError(Exception):
+    """When a (field, operator) combination would scan the table (OPERATORS_REQUIRE_INDEX)"""
+
+
+class QueryBudgetExceededError(Exception):
+    """Raised when a request exceeds OrmParamsPolicy.BUDGET"""
+
+
+class InvalidValueError(ValueError):
+    """Raised when values can not be converted to the type of their column."""
+
+    def __init__(self, message: str, errors: List[Tuple[str, Any, str]]) -> None:
+        super().__init__(message)
+        self.errors = errors
@@ -1,37 +1,85 @@
+from functools import partial
 from typing import (
+    TYPE_CHECKING,
     Annotated,
     Any,
+    AsyncIterator,
+    Dict,
     Iterable,
     List,
     Optional,
     Self,
+    Sequence,
     Set,
     Tuple,
     Union,
     cast,
 )
 
-from sqlalchemy import Select, and_, or_, select
-from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.sql import ColumnElement
-
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import DeclarativeBase, Session
+
+from ormparams.core.access import get_access_index
+from ormparams.core.coercion import coercer_for
+from ormparams.core.counting import estimate_count
+from ormparams.core.indexes import index_friendly, indexed_columns, seq_scan_report
+from ormparams.core.instrumentation import span, value_counts
+from ormparams.core.loading import eager_options
+from ormparams.core.pagination import decode_cursor, encode_cursor, keyset_predicate
+from ormparams.core.plan import (
+    FieldPlan,
+    FilterPlan,
+    OperatorPlan,
+    ParamPlan,
+    Violation,
+    logic_sequence,
+    plan_key,
+)
 from ormparams.core.policy import OrmParamsPolicy
-from ormparams.core.types import LogicExecutor, ParsedResult, SuffixSerializerFunction
+from ormparams.core.projection import is_column, projection_options
+from ormparams.core.relationships import resolve_path
+from ormparams.core.types import (
+    EMPTY_SERIALIZERS,
+    LogicExecutor,
+    ParsedResult,
+    PolicyReaction,
+    PolicySuffixOperatorFunction,
+    RelationshipStrategy,
+    SortKey,
+    SuffixOperatorFunction,
+    SuffixSerializerFunction,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class OrmParamsFilter:
+    """
+    Builds filtered SQLAlchemy statements from a ParsedResult.
+
+    [ NOTES ]:
+        - filter() keeps no per-request state on the instance: one long-lived
+          filter per endpoint can be shared between requests and threads,
+          passing `parsed` to every call.
+        - Compiled plans are shared through the policy (see get_plan).
+    """
+
     def __init__(
         self,
         policy: OrmParamsPolicy,
         model: Optional[DeclarativeBase] = None,
         parsed: Optional[ParsedResult] = None,
         query: Optional[Select[Any]] = None,
+        unindexed_operator: Optional[PolicyReaction] = None,
     ):
         self.policy = policy
         self.model = model
         self.query = query
         self.parsed = parsed
-        self._joined_models: Set[Tuple[type, str]] = set()
+        # reaction to unindexed (field, operator) pairs of this filter,
+        # enables the check even without policy.OPERATORS_REQUIRE_INDEX
+        self.unindexed_operator = unindexed_operator
 
     def filter(
         self,
@@ -43,6 +91,7 @@ class OrmParamsFilter:
         allowed_operations: Optional[List[str]] = None,
         excluded_fields: Optional[List[str]] = None,
         excluded_operations: Optional[List[str]] = None,
+        join_collections: bool = True,
     ) -> Select[Any]:
         """
         Apply filters to a SQLAlchemy query and build expressions using logical executors.
@@ -57,6 +106,9 @@ class OrmParamsFilter:
             - excluded_fields: list of fields explicitly excluded.
             - allowed_operations: list of suffixes/operations allowed.
             - excluded_operations: list of operations explicitly excluded.
+            - join_collections: False loads joined collections with selectinload
+                instead of contains_eager, for queries you LIMIT or stream
+                yourself (see eager_load).
 
                 -! If you have any relationships, make sure you excluded all
 
@@ -69,197 +121,853 @@ class OrmParamsFilter:
             - Supports logic as a single string ("AND"/"OR") or as a list of logic operators.
             - Applies serializers before building expressions if defined.
             - Uses SuffixSet to map suffixes to operator functions.
+            - Reuses compiled plans for requests of the same key shape (see get_plan).
+            - Applies ordering and keyset pagination of reserved params (see paginate).
+            - Loads only the requested columns of reserved params (see project).
+            - Eagerly loads joined/included relationships if enabled (see eager_load).
         """
-        model = model or self.model
-        if model is None:
-            raise TypeError("Model is required")
+        model, query, parsed = self._resolve(model, query, parsed)
+
+        plan = self.get_plan(
+            model,
+            parsed,
+            allowed_relationships=allowed_relationships,
+            allowed_fields=allowed_fields,
+            allowed_operations=allowed_operations,
+            excluded_fields=excluded_fields,
+            excluded_operations=excluded_operations,
+        )
+        query = self._execute_plan(plan, query, parsed)
+        return self._apply_reserved(
+            plan,
+            query,
+            model,
+            parsed,
+            allowed_relationships,
+            allowed_fields,
+            excluded_fields,
+            join_collections,
+        )
 
-        parsed = parsed or self.parsed
-        if parsed is None:
-            raise TypeError("Parsed parameters are required")
+    def filter_with_params(
+        self,
+        model: Optional[DeclarativeBase] = None,
+        query: Optional[Select[Any]] = None,
+        parsed: Optional[ParsedResult] = None,
+        allowed_relationships: Optional[List[str]] = None,
+        allowed_fields: Optional[List[str]] = None,
+        allowed_operations: Optional[List[str]] = None,
+        excluded_fields: Optional[List[str]] = None,
+        excluded_operations: Optional[List[str]] = None,
+        join_collections: bool = True,
+    ) -> Tuple[Select[Any], Dict[str, Any]]:
+        """
+        Same as `filter`, but values are emitted as named bindparam() placeholders
+        and returned separately.
+
+        [ EXAMPLE ]:
+            query, params = OrmParamsFilter(policy, Parent, parsed).filter_with_params()
+            session.execute(query, params)
+
+        [ NOTES ]:
+            - Placeholders are named "<field>_<operator>_<position>".
+            - Requests of the same key shape reuse the same where-clauses, so
+              SQLAlchemy's compiled cache is hit ("[cached since ...]" in engine logs).
+            - Suffixes registered with bindable=False still get literal values.
+            - Placeholders take the column's type, so values are always coerced
+              to it (as with policy.COERCE_VALUES); invalid ones raise
+              InvalidValueError.
+        """
+        model, query, parsed = self._resolve(model, query, parsed)
+
+        plan = self.get_plan(
+            model,
+            parsed,
+            allowed_relationships=allowed_relationships,
+            allowed_fields=allowed_fields,
+            allowed_operations=allowed_operations,
+            excluded_fields=excluded_fields,
+            excluded_operations=excluded_operations,
+        )
+        values = self._bind_values(plan, parsed, templated=True)
+        query = self._execute_plan(plan, query, parsed, values=values)
+        query = self._apply_reserved(
+            plan,
+            query,
+            model,
+            parsed,
+            allowed_relationships,
+            allowed_fields,
+            excluded_fields,
+            join_collections,
+        )
+        return query, values
 
-        query = query or self.query or select(cast(Any, model))
+    def _apply_reserved(
+        self,
+        plan: FilterPlan,
+        query: Select[Any],
+        model: DeclarativeBase,
+        parsed: ParsedResult,
+        allowed_relationships: Optional[List[str]],
+        allowed_fields: Optional[List[str]],
+        excluded_fields: Optional[List[str]],
+        join_collections: bool = True,
+    ) -> Select[Any]:
+        """Stages after filtering: paginate, project, eager_load."""
+        query = self.paginate(query, model, parsed, allowed_fields, excluded_fields)
+        query = self.project(
+            query, model, parsed, allowed_relationships, allowed_fields, excluded_fields
+        )
+        return self.eager_load(
+            query, plan, model, parsed, allowed_relationships, join_collections
+        )
 
-        for field_name, parsed_field in parsed.items():
-            expr, query = self._build_field_expression(
-                query,
-                field_name,
-                parsed_field,
-                base_model=model,
-                base_allowed_relationships=allowed_relationships,
-                base_allowed_fields=allowed_fields,
-                base_allowed_ops=allowed_operations,
-                base_excluded_fields=excluded_fields,
-                base_excluded_ops=excluded_operations,
-            )
+    def count_query(
+        self,
+        model: Optional[DeclarativeBase] = None,
+        query: Optional[Select[Any]] = None,
+        parsed: Optional[ParsedResult] = None,
+        allowed_relationships: Optional[List[str]] = None,
+        allowed_fields: Optional[List[str]] = None,
+        allowed_operations: Optional[List[str]] = None,
+        excluded_fields: Optional[List[str]] = None,
+        excluded_operations: Optional[List[str]] = None,
+    ) -> Select[Any]:
+        """
+        SELECT count(*) of the rows `filter` would return, ignoring pagination.
+
+        [ NOTES ]:
+            - Relationships with the "join" strategy are filtered with EXISTS
+              instead, so rows are not multiplied and no JOIN is needed.
+            - Without a base query: SELECT count(*) FROM <table> WHERE ...
+            - A base query is wrapped as a subquery without its ORDER BY;
+              eager loader options do not apply to subqueries.
+        """
+        custom_query = query is not None or self.query is not None
+        model, query, parsed = self._resolve(model, query, parsed)
+
+        plan = self.get_plan(
+            model,
+            parsed,
+            allowed_relationships=allowed_relationships,
+            allowed_fields=allowed_fields,
+            allowed_operations=allowed_operations,
+            excluded_fields=excluded_fields,
+            excluded_operations=excluded_operations,
+            join_strategy="exists",
+        )
+        if not custom_query:
+            base = select(func.count()).select_from(cast(Any, model))
+            return self._execute_plan(plan, base, parsed)
 
-            if expr is not None:
-                query = query.where(expr)
+        filtered = self._execute_plan(plan, query, parsed).order_by(None)
+        return select(func.count()).select_from(filtered.subquery())
 
-        self.query = query
-        return query
+    def count(self, session: Session, **filter_kwargs: Any) -> int:
+        """
+        Number of rows matching the filters (see count_query).
+
+        [ ESTIMATES ]:
+            With policy.COUNT_ESTIMATE_THRESHOLD set, the planner estimate is
+            returned when it is at least the threshold, skipping the exact count
+            (PostgreSQL; other backends always count exactly).
+        """
+        stmt = self.count_query(**filter_kwargs)
+
+        threshold = self.policy.COUNT_ESTIMATE_THRESHOLD
+        if threshold is not None:
+            estimate = estimate_count(session.connection(), stmt)
+            if estimate is not None and estimate >= threshold:
+                return estimate
 
-    def _build_field_expression(
+        return int(session.execute(stmt).scalar_one())
+
+    def paginate(
         self,
         query: Select[Any],
-        field_name,
-        parsed_field,
-        base_model: DeclarativeBase,
-        base_allowed_relationships=None,
-        base_allowed_fields=None,
-        base_excluded_fields=None,
-        base_allowed_ops=None,
-        base_excluded_ops=None,
-    ) -> Tuple[Optional[ColumnElement[Any]], Select[Any]]:
+        model: Optional[DeclarativeBase] = None,
+        parsed: Optional[ParsedResult] = None,
+        allowed_fields: Optional[List[str]] = None,
+        excluded_fields: Optional[List[str]] = None,
+    ) -> Select[Any]:
         """
-        Make hard-logical written query.
-
-        [ FLOW ]:
-            - Checks every parameter and operator for allowed/excluded rules.
-            - Serializes expression in priority:
-                suffix serializers -> param serializers -> field serializers
-            - Combines operational logic per param
-            - Combines parametric logic across params
-            - Returns SQLAlchemy expression
+        Apply ORDER BY, keyset predicate and LIMIT of the reserved parameters.
+
+        [ EXAMPLE ]:
+            ?_sort=-created_at,name
+            ?_sort=-created_at&_limit=20
+            ?_sort=-created_at&_limit=20&_after=<next_cursor of previous page>
+
+        [ NOTES ]:
+            - Called by filter(); no-op without reserved params or for plain dicts.
+            - Primary key columns are appended as tie-breakers, so pages are stable.
+            - Sort fields follow the same access rules as filters (EXCLUDED_FIELD).
+            - _after continues strictly after the cursor row, no OFFSET scan.
         """
-        if parsed_field is None:
-            return None, query
+        order_by = getattr(parsed, "order_by", ())
+        limit = getattr(parsed, "limit", None)
+        after = getattr(parsed, "after", None)
+        if not (order_by or limit or after):
+            return query
 
-        param_expressions: List[ColumnElement[Any]] = []
+        model = model or self.model
+        if model is None:
+            raise TypeError("Model is required")
 
-        for param in parsed_field.params:
-            if getattr(param, "relationships", None):
-                diff = set(param.relationships) - set(base_allowed_relationships or {})
-                if len(diff) != 0:
-                    self.policy.EXCEPTION_WRAPPER.not_allowed_relationship(
-                        ", ".join(f"'{i}'" for i in diff)
-                    )
-                query = self._apply_relationship_joins(
-                    query, base_model, param.relationships
-                )
-                model = self.get_relationships_model(param.relationships, base_model)
-            else:
-                model = base_model
+        keys = self._sort_keys(model, order_by, allowed_fields, excluded_fields, True)
+        columns = [column for _, column, _ in keys]
+        descending = [desc for _, _, desc in keys]
 
-            allowed_fields = getattr(
-                model, "ORMP_ALLOWED_FIELDS", base_allowed_fields or ["*"]
-            )
-            excluded_fields = getattr(
-                model, "ORMP_EXCLUDED_FIELDS", base_excluded_fields or []
+        query = query.order_by(
+            *(
+                column.desc() if desc else column.asc()
+                for column, desc in zip(columns, descending)
             )
+        )
 
-            excluded_ops = set(
-                getattr(model, "ORMP_EXCLUDED_OPERATIONS", base_excluded_ops or [])
-            )
-            allowed_ops = getattr(
-                model, "ORMP_ALLOWED_OPERATIONS", base_allowed_ops or ["*"]
-            )
-            if allowed_ops == "*" or allowed_ops == ["*"]:
-                allowed_ops_set: Union[str, Set[str]] = "*"
-            else:
-                allowed_ops_set = set(allowed_ops) - excluded_ops
-
-            if getattr(param, "relationships", None):
-                excluded_fields = list(
-                    set(excluded_fields + getattr(model, "ORMP_EXCLUDED_FIELDS", []))
-                )
-                excluded_ops = list(
-                    set(
-                        list(excluded_ops)
-                        + getattr(model, "ORMP_EXCLUDED_OPERATIONS", [])
-                    )
+        if after:
+            names = [name for name, _, _ in keys]
+            try:
+                values = decode_cursor(after, names)
+                coerced = []
+                for column, value in zip(columns, values):
+                    coercer = coercer_for(column)
+                    coerced.append(coercer(value) if coercer else value)
+            except (ValueError, KeyError) as e:
+                self.policy.EXCEPTION_WRAPPER.invalid_values(
+                    [(self.policy.AFTER_PARAM or "after", after, str(e))]
                 )
-                if allowed_ops_set != "*":
-                    allowed_ops_set = cast(Set[str], allowed_ops_set) - set(
-                        excluded_ops
-                    )
+            predicate = keyset_predicate(columns, descending, coerced)
+            if predicate is not None:
+                query = query.where(predicate)
 
-            if (
-                allowed_fields != "*"
-                and allowed_fields != ["*"]
-                and field_name not in allowed_fields
-            ) or (field_name in excluded_fields):
-                self.policy.EXCEPTION_WRAPPER.reactor(
+        if limit:
+            query = query.limit(limit)
+        return query
+
+    def project(
+        self,
+        query: Select[Any],
+        model: Optional[DeclarativeBase] = None,
+        parsed: Optional[ParsedResult] = None,
+        allowed_relationships: Optional[List[str]] = None,
+        allowed_fields: Optional[List[str]] = None,
+        excluded_fields: Optional[List[str]] = None,
+    ) -> Select[Any]:
+        """
+        Load only the columns listed in the projection parameter.
+
+        [ EXAMPLE ]:
+            ?_fields=id,name,parent.name
+            -> load_only(Child.id, Child.name), defaultload(Child.parent).load_only(Parent.name)
+
+        [ NOTES ]:
+            - Called by filter(); no-op without the reserved param or for plain dicts.
+            - Fields follow the same access rules as filters (EXCLUDED_FIELD),
+              relationships must be in allowed_relationships.
+            - Related columns only narrow what is loaded, relationships are not
+              eagerly loaded by this.
+            - Columns left out are deferred and loaded on access, e.g. sort fields
+              read by next_cursor; list them to avoid the extra query.
+        """
+        fields = getattr(parsed, "fields", ())
+        if not fields:
+            return query
+
+        model = model or self.model
+        if model is None:
+            raise TypeError("Model is required")
+
+        wrapper = self.policy.EXCEPTION_WRAPPER
+        columns: Dict[Tuple[Any, ...], List[Any]] = {}
+
+        for relationships, name in fields:
+            target, path = model, ()
+            if relationships:
+                diff = set(relationships) - set(allowed_relationships or {})
+                if diff:
+                    wrapper.not_allowed_relationship(", ".join(f"'{i}'" for i in diff))
+                rel_path = resolve_path(model, relationships, wrapper)
+                target, path = rel_path.target, rel_path.attributes
+
+            access = get_access_index(target, allowed_fields, excluded_fields)
+            column = access.column(name)
+            if column is None or not is_column(column):
+                wrapper.field_not_found(name)
+            if not access.allows_field(name):
+                wrapper.reactor(
                     self.policy.EXCLUDED_FIELD,
                     self.policy.get_logger,
-                    self.policy.EXCEPTION_WRAPPER.excluded_field,
-                    field_name,
+                    wrapper.excluded_field,
+                    name,
+                    violation_key=(name, "fields", "excluded_field"),
                 )
                 continue
+            columns.setdefault(path, []).append(column)
+
+        options = projection_options(columns)
+        return query.options(*options) if options else query
+
+    def eager_load(
+        self,
+        query: Select[Any],
+        plan: FilterPlan,
+        model: Optional[DeclarativeBase] = None,
+        parsed: Optional[ParsedResult] = None,
+        allowed_relationships: Optional[List[str]] = None,
+        join_collections: bool = True,
+    ) -> Select[Any]:
+        """
+        Add loader options for relationships when policy.EAGER_LOADING is on.
+
+        [ EXAMPLE ]:
+            ?children.value=C1              -> contains_eager(Parent.children)
+            ?_include=children.toys         -> selectinload(Parent.children).selectinload(Child.toys)
+
+        [ NOTES ]:
+            - Included relationships must be in allowed_relationships.
+            - Strategy per relationship: ORMP_EAGER_LOADING (see core/loading.py).
+            - contains_eager collections need .unique() on the result.
+            - A LIMIT would count joined rows and cut the last parent's collection,
+              so with the limit parameter (or join_collections=False) joined
+              collections are loaded with selectinload, i.e. in full.
+        """
+        if not self.policy.EAGER_LOADING:
+            return query
+
+        model = model or self.model
+        if model is None:
+            raise TypeError("Model is required")
 
-            field_attr = getattr(model, field_name)
-            value = param.value
+        wrapper = self.policy.EXCEPTION_WRAPPER
+        included = []
+        for relationships in getattr(parsed, "include", ()):
+            diff = set(relationships) - set(allowed_relationships or {})
+            if diff:
+                wrapper.not_allowed_relationship(", ".join(f"'{i}'" for i in diff))
+            included.append(resolve_path(model, relationships, wrapper).attributes)
+
+        limited = bool(getattr(parsed, "limit", None))
+        options = eager_options(
+            plan.joined_paths, included, join_collections and not limited
+        )
+        return query.options(*options) if options else query
+
+    def next_cursor(
+        self,
+        rows: Sequence[Any],
+        model: Optional[DeclarativeBase] = None,
+        parsed: Optional[ParsedResult] = None,
+        allowed_fields: Optional[List[str]] = None,
+        excluded_fields: Optional[List[str]] = None,
+    ) -> Optional[str]:
+        """
+        Cursor of the page after `rows`, or None if `rows` is the last page.
 
-            op_exprs: List[ColumnElement[Any]] = []
-            for op in param.operators:
-                if allowed_ops_set != "*" and op not in cast(Set[str], allowed_ops_set):
-                    self.policy.EXCEPTION_WRAPPER.reactor(
-                        self.policy.EXCLUDED_OPERATOR,
+        [ EXAMPLE ]:
+            rows = session.execute(flt.filter(parsed=parsed)).scalars().all()
+            return {"items": rows, "next": flt.next_cursor(rows, parsed=parsed)}
+        """
+        parsed = parsed if parsed is not None else self.parsed
+        limit = getattr(parsed, "limit", None)
+        if not rows or limit is None or len(rows) < limit:
+            return None
+
+        model = model or self.model
+        if model is None:
+            raise TypeError("Model is required")
+
+        keys = self._sort_keys(
+            model,
+            getattr(parsed, "order_by", ()),
+            allowed_fields,
+            excluded_fields,
+            False,
+        )
+        last = rows[-1]
+        return encode_cursor(
+            [name for name, _, _ in keys], [getattr(last, name) for name, _, _ in keys]
+        )
+
+    def _sort_keys(
+        self,
+        model: DeclarativeBase,
+        order_by: Sequence[SortKey],
+        allowed_fields: Optional[List[str]],
+        excluded_fields: Optional[List[str]],
+        report: bool,
+    ) -> List[Tuple[str, Any, bool]]:
+        """
+        Authorized (name, column, descending) sort keys followed by the primary key.
+        Rejected fields (access rules, SORT_REQUIRES_INDEX) are dropped;
+        with `report` they go through the reactor.
+        """
+        access = get_access_index(model, allowed_fields, excluded_fields)
+        wrapper = self.policy.EXCEPTION_WRAPPER
+        indexed = indexed_columns(model) if self.policy.SORT_REQUIRES_INDEX else None
+
+        keys: List[Tuple[str, Any, bool]] = []
+        for name, desc in order_by:
+            column = access.column(name)
+            if column is None or hasattr(getattr(column, "property", None), "mapper"):
+                wrapper.field_not_found(name)
+            if not access.allows_field(name):
+                if report:
+                    wrapper.reactor(
+                        self.policy.EXCLUDED_FIELD,
                         self.policy.get_logger,
-                        self.policy.EXCEPTION_WRAPPER.excluded_operator,
-                        op,
+                        wrapper.excluded_field,
+                        name,
+                        violation_key=(name, "sort", "excluded_field"),
                     )
-                    continue
+                continue
+            if indexed is not None and name not in indexed:
+                if report:
+                    wrapper.reactor(
+                        self.policy.UNINDEXED_SORT,
+                        self.policy.get_logger,
+                        wrapper.unindexed_sort,
+                        name,
+                        violation_key=(name, "sort", "unindexed_sort"),
+                    )
+                continue
+            if all(name != key for key, _, _ in keys):
+                keys.append((name, column, desc))
 
-                suffix = self.policy.SUFFIX_SET.get(op)
-                if not suffix:
-                    raise ValueError(f"Suffix '{op}' not found in SuffixSet")
+        for name in access.primary_key:
+            if all(name != key for key, _, _ in keys):
+                keys.append((name, access.column(name), False))
+        return keys
 
-                key = f"{field_name}__{op}"
-                field_serializers: List[SuffixSerializerFunction] = []
-                key_serializers: List[SuffixSerializerFunction] = []
-                if getattr(parsed_field, "SERIALIZERS", None):
-                    field_serializers = (
-                        parsed_field.SERIALIZERS.get(field_name, []) or []
-                    )
-                    key_serializers = parsed_field.SERIALIZERS.get(key, []) or []
+    async def fetch_all(
+        self, session: "AsyncSession", **filter_kwargs: Any
+    ) -> Sequence[Any]:
+        """
+        Execute the filtered statement on an AsyncSession and return all objects.
 
-                serializers: List[SuffixSerializerFunction] = []
-                serializers.extend(getattr(suffix, "serializers", []) or [])
-                serializers.extend(field_serializers)
-                serializers.extend(key_serializers)
+        [ ARGS ]:
+            - session: sqlalchemy.ext.asyncio.AsyncSession
+            - filter_kwargs: arguments of `filter` (model, query, parsed, allowed_*, ...)
 
-                for serializer in serializers:
-                    value = serializer(value)
+        [ NOTES ]:
+            - With policy.EAGER_LOADING rows are made unique, as contains_eager
+              collections repeat the parent once per joined row.
+        """
+        query, params = self.filter_with_params(**filter_kwargs)
+        result = await session.execute(query, params)
+        if self.policy.EAGER_LOADING:
+            result = result.unique()
+        return cast(Sequence[Any], result.scalars().all())
 
-                op_exprs.append(suffix.function(field_attr, value, model))
+    async def fetch_page(
+        self,
+        session: "AsyncSession",
+        limit: int,
+        offset: int = 0,
+        **filter_kwargs: Any,
+    ) -> Sequence[Any]:
+        """
+        Same as `fetch_all`, limited to `limit` objects starting at `offset`.
+        Joined collections are eager loaded with selectinload (see eager_load).
+        """
+        query, params = self.filter_with_params(join_collections=False, **filter_kwargs)
+        result = await session.execute(query.limit(limit).offset(offset), params)
+        return cast(Sequence[Any], result.scalars().all())
+
+    async def fetch_count(self, session: "AsyncSession", **filter_kwargs: Any) -> int:
+        """Same as `count`, on an AsyncSession."""
+        return await session.run_sync(
+            lambda sync_session: self.count(sync_session, **filter_kwargs)
+        )
 
-            if not op_exprs:
-                continue
+    async def stream(
+        self,
+        session: "AsyncSession",
+        yield_per: int = 100,
+        **filter_kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """
+        Stream objects of the filtered statement with a server-side cursor.
+
+        [ EXAMPLE ]:
+            async for parent in flt.stream(session, parsed=parsed):
+                ...
 
-            ops_logic = (
-                parsed_field.OPERATIONAL_LOGIC_EXECUTOR
-                if isinstance(parsed_field.OPERATIONAL_LOGIC_EXECUTOR, list)
-                else [parsed_field.OPERATIONAL_LOGIC_EXECUTOR] * (len(op_exprs) - 1)
+        [ NOTES ]:
+            - At most `yield_per` rows are buffered at a time.
+            - The result is closed when iteration stops, even on break/errors.
+            - Joined collections are eager loaded with selectinload, yield_per
+              does not support contains_eager collections (see eager_load).
+        """
+        query, params = self.filter_with_params(join_collections=False, **filter_kwargs)
+        result = await session.stream_scalars(
+            query, params, execution_options={"yield_per": yield_per}
+        )
+        try:
+            async for obj in result:
+                yield obj
+        finally:
+            await result.close()
+
+    def _resolve(
+        self,
+        model: Optional[DeclarativeBase],
+        query: Optional[Select[Any]],
+        parsed: Optional[ParsedResult],
+    ) -> Tuple[DeclarativeBase, Select[Any], ParsedResult]:
+        model = model or self.model
+        if model is None:
+            raise TypeError("Model is required")
+
+        if parsed is None:
+            parsed = self.parsed
+        if parsed is None:
+            raise TypeError("Parsed parameters are required")
+
+        if query is None:
+            query = self.query if self.query is not None else select(cast(Any, model))
+        return model, query, parsed
+
+    def get_plan(
+        self,
+        model: DeclarativeBase,
+        parsed: ParsedResult,
+        allowed_relationships: Optional[List[str]] = None,
+        allowed_fields: Optional[List[str]] = None,
+        allowed_operations: Optional[List[str]] = None,
+        excluded_fields: Optional[List[str]] = None,
+        excluded_operations: Optional[List[str]] = None,
+        join_strategy: Optional[RelationshipStrategy] = None,
+    ) -> FilterPlan:
+        """
+        Return the compiled plan for the key shape of `parsed`.
+
+        Plans are cached in policy.PLAN_CACHE, keyed by model, suffix set and
+        the fields/relationships/operators/logic executors of the request,
+        so requests differing only in values reuse the same plan.
+
+        `join_strategy` replaces the "join" relationship strategy
+        (e.g. "exists" for count statements).
+
+        With policy.BUDGET, plans over budget raise QueryBudgetExceededError
+        and are not cached.
+        """
+        with span(self.policy.INSTRUMENTATION, "plan") as counts:
+            key = plan_key(
+                model,
+                self.policy.SUFFIX_SET,
+                self.policy.SUFFIX_DELIMITER,
+                parsed,
+                self.policy.RELATIONSHIP_STRATEGY,
+                str(self.policy.COERCE_VALUES),
+                allowed_relationships,
+                allowed_fields,
+                allowed_operations,
+                excluded_fields,
+                excluded_operations,
+                join_strategy,
             )
+            plan = self.policy.PLAN_CACHE.get(key)
+            cached = plan is not None
+            if plan is None:
+                plan = self._compile_plan(
+                    model,
+                    parsed,
+                    allowed_relationships,
+                    allowed_fields,
+                    allowed_operations,
+                    excluded_fields,
+                    excluded_operations,
+                    join_strategy,
+                )
+
+            # before caching: over-budget shapes must not evict valid plans
+            if self.policy.BUDGET is not None:
+                self.policy.BUDGET.check_plan(plan, self.policy.EXCEPTION_WRAPPER)
+
+            if not cached:
+                self.policy.PLAN_CACHE.set(key, plan)
+                counts["cache_miss"] = 1
+        return plan
+
+    def _execute_plan(
+        self,
+        plan: FilterPlan,
+        query: Select[Any],
+        parsed: ParsedResult,
+        values: Optional[Dict[str, Any]] = None,
+    ) -> Select[Any]:
+        """
+        Replay policy violations, apply joins and bind values of `parsed`.
+        If `values` are given, bindparam() placeholders are used instead.
 
-            combined_op_expr = op_exprs[0]
-            for logic, next_expr in zip(ops_logic, op_exprs[1:]):
-                combined_op_expr = (
-                    and_(combined_op_expr, next_expr)
-                    if logic == "AND"
-                    else or_(combined_op_expr, next_expr)
+        [ NOTES ]:
+            - Joins are tracked per call, nothing is stored on the instance,
+              so one filter can be shared between requests and threads.
+        """
+        wrapper = self.policy.EXCEPTION_WRAPPER
+        instrumentation = self.policy.INSTRUMENTATION
+
+        with span(instrumentation, "authorize") as counts:
+            for rule, method, args, key in plan.violations:
+                reaction = self._reaction(rule)
+                if reaction is None:
+                    continue
+                wrapper.reactor(
+                    reaction,
+                    self.policy.get_logger,
+                    getattr(wrapper, method),
+                    *args,
+                    violation_key=key,
                 )
+            counts["violations"] = len(plan.violations)
+
+        with span(instrumentation, "join") as counts:
+            joined: Set[Tuple[type, str]] = set()
+            for join_key, rel_attr in plan.joins:
+                if join_key not in joined:
+                    query = query.join(rel_attr)
+                    joined.add(join_key)
+            counts["joins"] = len(joined)
+
+        literal_values = self._bind_values(plan, parsed) if values is None else None
+
+        with span(instrumentation, "build") as counts:
+            clauses = (
+                plan.where_template(values)
+                if literal_values is None
+                else plan.clauses_for(literal_values)
+            )
+            for expr in clauses:
+                if expr is not None:
+                    query = query.where(expr)
+            counts["clauses"] = len(clauses)
 
-            param_expressions.append(combined_op_expr)
+        return query
 
-        if not param_expressions:
-            return None, query
+    def _reaction(self, rule: str) -> Optional[PolicyReaction]:
+        """Reaction to a recorded violation, None if its check is disabled."""
+        if rule == "UNINDEXED_OPERATOR":
+            if self.unindexed_operator is not None:
+                return self.unindexed_operator
+            if not self.policy.OPERATORS_REQUIRE_INDEX:
+                return None
+        return cast(PolicyReaction, getattr(self.policy, rule))
 
-        params_logic = (
-            parsed_field.PARAMETRIC_LOGIC_EXECUTOR
-            if isinstance(parsed_field.PARAMETRIC_LOGIC_EXECUTOR, list)
-            else [parsed_field.PARAMETRIC_LOGIC_EXECUTOR] * (len(param_expressions) - 1)
+    def unindexed_report(
+        self,
+        model: Optional[DeclarativeBase] = None,
+        allowed_fields: Optional[List[str]] = None,
+        excluded_fields: Optional[List[str]] = None,
+        allowed_operations: Optional[List[str]] = None,
+        excluded_operations: Optional[List[str]] = None,
+    ) -> List[Tuple[str, str]]:
+        """
+        Allowed (column, operator) pairs of `model` that no index can serve,
+        i.e. the ones OPERATORS_REQUIRE_INDEX reacts to (see indexes.seq_scan_report).
+        """
+        model = model or self.model
+        if model is None:
+            raise TypeError("Model is required")
+        return seq_scan_report(
+            model,
+            self.policy.SUFFIX_SET,
+            allowed_fields,
+            excluded_fields,
+            allowed_operations,
+            excluded_operations,
         )
-        combined_param_expr = param_expressions[0]
-        for logic, next_expr in zip(params_logic, param_expressions[1:]):
-            combined_param_expr = (
-                and_(combined_param_expr, next_expr)
-                if logic == "AND"
-                else or_(combined_param_expr, next_expr)
+
+    def _bind_values(
+        self, plan: FilterPlan, parsed: ParsedResult, templated: bool = False
+    ) -> Dict[str, Any]:
+        """plan.bind_values, timed as the "serialize" phase."""
+        instrumentation = self.policy.INSTRUMENTATION
+        with span(instrumentation, "serialize") as counts:
+            values = plan.bind_values(
+                parsed, self.policy.EXCEPTION_WRAPPER, templated=templated
+            )
+            if self.policy.BUDGET is not None:
+                self.policy.BUDGET.check_values(values, self.policy.EXCEPTION_WRAPPER)
+            if instrumentation is not None:
+                counts.update(value_counts(values))
+                counts["serializers"] = plan.serializer_count(parsed)
+        return values
+
+    def _compile_plan(
+        self,
+        base_model: DeclarativeBase,
+        parsed: ParsedResult,
+        base_allowed_relationships: Optional[List[str]] = None,
+        base_allowed_fields: Optional[List[str]] = None,
+        base_allowed_ops: Optional[List[str]] = None,
+        base_excluded_fields: Optional[List[str]] = None,
+        base_excluded_ops: Optional[List[str]] = None,
+        join_strategy: Optional[RelationshipStrategy] = None,
+    ) -> FilterPlan:
+        """
+        Make hard-logical written plan.
+
+        [ FLOW ]:
+            - Checks every parameter and operator for allowed/excluded rules.
+                (violations are recorded and replayed on every execution)
+            - Resolves relationship chains, their joins and target columns.
+            - Resolves serializers in priority:
+                suffix serializers -> field serializers -> field__op serializers
+                (the last two are per-request and looked up while binding)
+            - Expands operational logic per param and parametric logic per field.
+        """
+        joins: Dict[Tuple[type, str], Any] = {}
+        bind_position = 0
+        violations: List[Violation] = []
+        field_plans: List[FieldPlan] = []
+
+        for field_name, parsed_field in parsed.items():
+            param_plans: List[Optional[ParamPlan]] = []
+
+            for param in parsed_field.params:
+                if getattr(param, "relationships", None):
+                    diff = set(param.relationships) - set(
+                        base_allowed_relationships or {}
+                    )
+                    if len(diff) != 0:
+                        self.policy.EXCEPTION_WRAPPER.not_allowed_relationship(
+                            ", ".join(f"'{i}'" for i in diff)
+                        )
+                    rel_path = resolve_path(
+                        base_model, param.relationships, self.policy.EXCEPTION_WRAPPER
+                    )
+                    strategy = self.get_relationship_strategy(
+                        base_model, param.relationships[0]
+                    )
+                    if strategy == "join" and join_strategy is not None:
+                        strategy = join_strategy
+                    if strategy == "join":
+                        for join_key, rel_attr in rel_path.joins:
+                            joins.setdefault(join_key, rel_attr)
+                    path = rel_path.attributes
+                    model = rel_path.target
+                else:
+                    model = base_model
+                    strategy, path = "join", ()
+
+                access = get_access_index(
+                    model,
+                    base_allowed_fields,
+                    base_excluded_fields,
+                    base_allowed_ops,
+                    base_excluded_ops,
+                )
+
+                if not access.allows_field(field_name):
+                    violations.append(
+                        (
+                            "EXCLUDED_FIELD",
+                            "excluded_field",
+                            (field_name,),
+                            (
+                                field_name,
+                                self.policy.SUFFIX_DELIMITER.join(param.operators),
+                                "excluded_field",
+                            ),
+                        )
+                    )
+                    param_plans.append(None)
+                    continue
+
+                field_attr = access.column(field_name)
+                if field_attr is None:
+                    self.policy.EXCEPTION_WRAPPER.field_not_found(field_name)
+
+                op_plans: List[OperatorPlan] = []
+                for op in param.operators:
+                    if not access.allows_operation(op):
+                        violations.append(
+                            (
+                                "EXCLUDED_OPERATOR",
+                                "excluded_operator",
+                                (op,),
+                                (field_name, op, "excluded_operator"),
+                            )
+                        )
+                        continue
+
+                    suffix = self.policy.SUFFIX_SET.get(op)
+                    if not suffix:
+                        raise ValueError(f"Suffix '{op}' not found in SuffixSet")
+
+                    if not index_friendly(model, field_name, suffix):
+                        # only replayed if the check is enabled (see _reaction)
+                        violations.append(
+                            (
+                                "UNINDEXED_OPERATOR",
+                                "unindexed_operator",
+                                (field_name, op),
+                                (field_name, op, "unindexed_operator"),
+                            )
+                        )
+
+                    op_plans.append(
+                        OperatorPlan(
+                            function=(
+                                partial(
+                                    cast(PolicySuffixOperatorFunction, suffix.function),
+                                    policy=self.policy,
+                                )
+                                if suffix.takes_policy
+                                else cast(SuffixOperatorFunction, suffix.function)
+                            ),
+                            serializers=tuple(getattr(suffix, "serializers", []) or []),
+                            serializer_key=f"{field_name}{self.policy.SUFFIX_DELIMITER}{op}",
+                            bind_name=f"{field_name}_{op}_{bind_position}",
+                            operator=op,
+                            bindable=getattr(suffix, "bindable", True),
+                            coercer=(
+                                coercer_for(field_attr)
+                                if getattr(suffix, "coerce", True)
+                                else None
+                            ),
+                            coerce=self.policy.COERCE_VALUES,
+                            takes_value=suffix.takes_policy,
+                        )
+                    )
+                    bind_position += 1
+
+                if not op_plans:
+                    param_plans.append(None)
+                    continue
+
+                param_plans.append(
+                    ParamPlan(
+                        model=model,
+                        column=field_attr,
+                        operators=tuple(op_plans),
+                        logic=logic_sequence(
+                            parsed_field.OPERATIONAL_LOGIC_EXECUTOR, len(op_plans)
+                        ),
+                        relationships=tuple(param.relationships),
+                        path=path,
+                        strategy=strategy,
+                    )
+                )
+
+            survivors = sum(1 for p in param_plans if p is not None)
+            field_plans.append(
+                FieldPlan(
+                    name=field_name,
+                    params=tuple(param_plans),
+                    logic=logic_sequence(
+                        parsed_field.PARAMETRIC_LOGIC_EXECUTOR, survivors
+                    ),
+                )
             )
 
-        return combined_param_expr, query
+        return FilterPlan(
+            fields=tuple(field_plans),
+            joins=tuple(joins.items()),
+            violations=tuple(violations),
+        )
 
     def get_relationships_model(
         self,
@@ -279,57 +987,33 @@ class OrmParamsFilter:
         if model is None:
             raise TypeError("Base model is required for resolving relationships")
 
-        current_model = model
-
         for rel_name in relationships:
             if allowed_relationships and rel_name not in allowed_relationships:
                 self.policy.EXCEPTION_WRAPPER.reactor(
                     self.policy.NOT_ALLOWED_RELATIONSHIP,
                     self.policy.get_logger,
                     self.policy.EXCEPTION_WRAPPER.not_allowed_relationship,
+                    rel_name,
                 )
 
-            attr = getattr(current_model, rel_name, None)
-            if attr is None:
-                self.policy.EXCEPTION_WRAPPER.field_not_found(
-                    f"Relationship '{rel_name}' on model {current_model.__name__} not found"
-                )
-
-            prop = getattr(attr, "property", None)
-            if prop is None or not hasattr(prop, "mapper"):
-                self.policy.EXCEPTION_WRAPPER.field_not_found(
-                    f"'{rel_name}' on model {current_model.__name__} is not a relationship"
-                )
-
-            current_model = prop.mapper.class_
+        path = resolve_path(model, relationships, self.policy.EXCEPTION_WRAPPER)
+        return cast(DeclarativeBase, path.target)
 
-        return current_model
-
-    def _apply_relationship_joins(
-        self,
-        query: Select[Any],
-        base_model: DeclarativeBase,
-        relationships_chain: List[str],
-    ) -> Select[Any]:
+    def get_relationship_strategy(
+        self, base_model: DeclarativeBase, relationship: str
+    ) -> RelationshipStrategy:
         """
-        Automatically join all relationships in the chain if they are not already joined.
+        How filters through `relationship` of `base_model` are applied.
 
-        [ARGS]:
-            - query: current SQLAlchemy Select object
-            - base_model: starting model for the relationship chain
-            - relationships_chain: list of relationship names to join
-        [RETURNS]:
-            - updated query with necessary joins applied
-        """
-        current_model = base_model
-        for rel_name in relationships_chain:
-            join_key = (current_model, rel_name)
-            if join_key not in self._joined_models:
-                rel_attr = getattr(current_model, rel_name)
-                query = query.join(rel_attr)
-                self._joined_models.add(join_key)
-            current_model = getattr(rel_attr, "property").mapper.class_
-        return query
+        [ PRIORITY ]:
+            - base_model.ORMP_RELATIONSHIP_STRATEGIES[relationship]
+            - policy.RELATIONSHIP_STRATEGY
+        """
+        strategies = getattr(base_model, "ORMP_RELATIONSHIP_STRATEGIES", None) or {}
+        return cast(
+            RelationshipStrategy,
+            strategies.get(relationship, self.policy.RELATIONSHIP_STRATEGY),
+        )
 
     def apply_serializer(
         self,
@@ -375,6 +1059,8 @@ class OrmParamsFilter:
         else:
             serializer_list = [serializers]
 
+        if parsed_field.SERIALIZERS is EMPTY_SERIALIZERS:  # type: ignore[union-attr]
+            parsed_field.SERIALIZERS = {}  # type: ignore[union-attr]
         parsed_field.SERIALIZERS[field_name] = serializer_list  # type: ignore[index]
 
         return self
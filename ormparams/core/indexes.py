@@ -0,0 +1,92 @@
+from typing import Any, FrozenSet, Iterable, List, Optional, Sequence, Tuple, Union
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import UniqueConstraint, inspect
+from sqlalchemy.orm.exc import UnmappedColumnError
+
+from ormparams.core.access import get_access_index
+from ormparams.core.projection import is_column
+from ormparams.core.suffixes import SuffixSet
+
+_leading: "WeakKeyDictionary[type, FrozenSet[str]]" = WeakKeyDictionary()
+
+
+def _index_column_lists(model: Any) -> Iterable[Tuple[Any, ...]]:
+    table = model.__table__
+    yield tuple(table.primary_key.columns)
+    for index in table.indexes:
+        yield tuple(index.columns)
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            yield tuple(constraint.columns)
+
+
+def indexed_columns(model: Any) -> FrozenSet[str]:
+    """
+    Attribute names of `model` columns that lead an index.
+
+    [ NOTES ]:
+        - Sources: primary key, __table__.indexes (incl. Column(index=True))
+          and unique constraints.
+        - Only the leading column counts: a B-tree index on (a, b) can serve
+          ORDER BY a / WHERE a = ..., not b alone.
+        - Computed once per mapped class.
+    """
+    names = _leading.get(model)
+    if names is None:
+        mapper = inspect(model)
+        found = set()
+        for columns in _index_column_lists(model):
+            if not columns:
+                continue
+            try:
+                found.add(mapper.get_property_by_column(columns[0]).key)
+            except UnmappedColumnError:
+                continue
+        names = _leading[model] = frozenset(found)
+    return names
+
+
+def index_friendly(model: Any, field_name: str, suffix: Any) -> bool:
+    """
+    Whether filtering `field_name` of `model` with `suffix` can use an index:
+    the suffix is index_friendly and the column leads an index.
+    """
+    return getattr(suffix, "index_friendly", True) and field_name in indexed_columns(
+        model
+    )
+
+
+def seq_scan_report(
+    model: Any,
+    suffix_set: SuffixSet,
+    allowed_fields: Optional[Union[str, Sequence[str]]] = None,
+    excluded_fields: Optional[Union[str, Sequence[str]]] = None,
+    allowed_operations: Optional[Union[str, Sequence[str]]] = None,
+    excluded_operations: Optional[Union[str, Sequence[str]]] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Allowed (column, operator) combinations of `model` no index can serve,
+    i.e. the ones that would make the database scan the table.
+
+    [ EXAMPLE ]:
+        seq_scan_report(User, policy.SUFFIX_SET)
+        -> [("email", "contains"), ("email", "endswith"), ("bio", "exact"), ...]
+    """
+    access = get_access_index(
+        model, allowed_fields, excluded_fields, allowed_operations, excluded_operations
+    )
+    report = []
+    for name, attribute in access.columns.items():
+        if not is_column(attribute) or not access.allows_field(name):
+            continue
+        for operator, suffix in suffix_set.all().items():
+            if access.allows_operation(operator) and not index_friendly(
+                model, name, suffix
+            ):
+                report.append((name, operator))
+    return report
+
+
+def clear_indexed_columns() -> None:
+    _leading.clear()
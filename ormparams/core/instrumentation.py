@@ -0,0 +1,163 @@
+import threading
+from bisect import bisect_left
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+Instrumentation = Callable[[str, float, Mapping[str, int]], None]
+"""
+Callback receiving (phase, duration in seconds, counts) after every phase.
+
+[ PHASES ]:
+    - "parse": parser, counts params/fields
+    - "plan": plan lookup and compilation, counts cache_miss
+    - "authorize": replay of policy violations, counts violations
+    - "join": joins applied, counts joins
+    - "serialize": serializers and coercion, counts values/serializers/in_list_*
+    - "build": where-clauses, counts clauses
+"""
+
+
+class _NullCounts(Dict[str, int]):
+    """Counts of a disabled span, writes are dropped."""
+
+    def __setitem__(self, key: str, value: int) -> None:
+        pass
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+class _Span:
+    __slots__ = ("callback", "phase", "counts", "start")
+
+    def __init__(self, callback: Instrumentation, phase: str) -> None:
+        self.callback = callback
+        self.phase = phase
+        self.counts: Dict[str, int] = {}
+
+    def __enter__(self) -> Dict[str, int]:
+        self.start = perf_counter()
+        return self.counts
+
+    def __exit__(self, exc_type: Any, *exc: Any) -> None:
+        if exc_type is None:
+            self.callback(self.phase, perf_counter() - self.start, self.counts)
+
+
+class _NullSpan:
+    __slots__ = ()
+    counts = _NullCounts()
+
+    def __enter__(self) -> Dict[str, int]:
+        return self.counts
+
+    def __exit__(self, *exc: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(callback: Optional[Instrumentation], phase: str) -> Any:
+    """
+    Time a phase: `with span(policy.INSTRUMENTATION, "join") as counts: ...`.
+    Without a callback nothing is timed or recorded.
+    """
+    if callback is None:
+        return _NULL_SPAN
+    return _Span(callback, phase)
+
+
+def value_counts(values: Mapping[str, Any]) -> Dict[str, int]:
+    """Number of bound values and sizes of the list ones (e.g. "in")."""
+    sizes = [len(v) for v in values.values() if isinstance(v, (list, tuple))]
+    return {
+        "values": len(values),
+        "in_lists": len(sizes),
+        "in_list_items": sum(sizes),
+        "in_list_max": max(sizes, default=0),
+    }
+
+
+BUCKETS: Tuple[float, ...] = tuple(1e-6 * 2**k for k in range(25))
+"""Upper bounds of histogram buckets: 1µs doubling up to ~16.8s, then overflow."""
+
+
+class HistogramCollector:
+    """
+    In-memory Instrumentation: per-phase duration histograms and count totals.
+
+    [ EXAMPLE ]:
+        collector = HistogramCollector()
+        policy = OrmParamsPolicy(INSTRUMENTATION=collector)
+        ...
+        collector.percentile("serialize", 0.95)
+        collector.snapshot()
+
+    [ NOTES ]:
+        - Thread-safe, fixed memory per phase (len(BUCKETS) + 1 buckets).
+        - Percentiles are bucket upper bounds, i.e. accurate within a factor of 2.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._phases: Dict[str, Dict[str, Any]] = {}
+
+    def __call__(self, phase: str, duration: float, counts: Mapping[str, int]) -> None:
+        with self._lock:
+            stats = self._phases.get(phase)
+            if stats is None:
+                stats = self._phases[phase] = {
+                    "calls": 0,
+                    "total": 0.0,
+                    "min": duration,
+                    "max": duration,
+                    "buckets": [0] * (len(BUCKETS) + 1),
+                    "counts": {},
+                    "max_counts": {},
+                }
+            stats["calls"] += 1
+            stats["total"] += duration
+            stats["min"] = min(stats["min"], duration)
+            stats["max"] = max(stats["max"], duration)
+            stats["buckets"][bisect_left(BUCKETS, duration)] += 1
+
+            totals, maxima = stats["counts"], stats["max_counts"]
+            for key, value in counts.items():
+                totals[key] = totals.get(key, 0) + value
+                maxima[key] = max(maxima.get(key, value), value)
+
+    def percentile(self, phase: str, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (0 < q <= 1) of `phase`."""
+        with self._lock:
+            stats = self._phases.get(phase)
+            if stats is None:
+                return None
+            buckets: List[int] = list(stats["buckets"])
+            calls: int = stats["calls"]
+            largest: float = stats["max"]
+
+        rank = q * calls
+        seen = 0
+        for i, n in enumerate(buckets):
+            seen += n
+            if seen >= rank and n:
+                return min(BUCKETS[i], largest) if i < len(BUCKETS) else largest
+        return largest
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Copy of every phase: calls, total/min/max seconds, buckets, counts."""
+        with self._lock:
+            return {
+                phase: {
+                    **stats,
+                    "buckets": list(stats["buckets"]),
+                    "counts": dict(stats["counts"]),
+                    "max_counts": dict(stats["max_counts"]),
+                }
+                for phase, stats in self._phases.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._phases.clear()
@@ -0,0 +1,74 @@
+from typing import Any, Iterable, List, Optional, Set, Tuple, cast
+
+from sqlalchemy.orm import contains_eager, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from ormparams.core.types import EagerLoadStrategy
+
+AttributePath = Tuple[Any, ...]
+
+
+def configured_strategy(attribute: Any) -> Optional[EagerLoadStrategy]:
+    """ORMP_EAGER_LOADING entry of the model owning relationship `attribute`."""
+    strategies = getattr(attribute.class_, "ORMP_EAGER_LOADING", None) or {}
+    return cast(Optional[EagerLoadStrategy], strategies.get(attribute.key))
+
+
+def eager_options(
+    joined: Iterable[AttributePath],
+    included: Iterable[AttributePath],
+    join_collections: bool = True,
+) -> List[LoaderOption]:
+    """
+    Loader options for relationship chains joined for filtering and included ones.
+
+    [ FLOW ]:
+        Every hop of a chain gets, unless ORMP_EAGER_LOADING says otherwise:
+            - contains_eager: the hop is joined by the filter, the JOIN is reused
+            - selectinload: one extra SELECT ... WHERE key IN (...) per hop,
+              SQLAlchemy sends the keys in batches
+        "none" stops the chain there, "contains" on a hop that is not joined
+        (or below a selectinload hop) falls back to selectinload.
+
+    [ NOTES ]:
+        - contains_eager fills collections with the joined rows only, i.e. the
+          ones matching the filter; use "selectin" to load full collections.
+        - Results with contains_eager collections need .unique().
+        - join_collections=False loads collections with selectinload even if
+          joined: a LIMIT counts joined rows and would cut the last collection,
+          yield_per can not be combined with joined collections.
+    """
+    joined_prefixes: Set[AttributePath] = set()
+    for path in joined:
+        joined_prefixes.update(path[: i + 1] for i in range(len(path)))
+
+    paths = dict.fromkeys(path for path in joined if path)
+    paths.update(dict.fromkeys(path for path in included if path))
+
+    options: List[LoaderOption] = []
+    for path in paths:
+        option: Any = None
+        chain_joined = True
+        for i, attribute in enumerate(path):
+            can_join = (
+                chain_joined
+                and path[: i + 1] in joined_prefixes
+                and (join_collections or not attribute.property.uselist)
+            )
+            strategy = configured_strategy(attribute)
+            if strategy is None:
+                strategy = "contains" if can_join else "selectin"
+            if strategy == "none":
+                break
+            if strategy == "contains" and not can_join:
+                strategy = "selectin"
+            chain_joined = strategy == "contains"
+
+            loader = contains_eager if strategy == "contains" else selectinload
+            if option is None:
+                option = loader(attribute)
+            else:
+                option = getattr(option, loader.__name__)(attribute)
+        if option is not None:
+            options.append(option)
+    return options
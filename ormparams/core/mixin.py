@@ -1,4 +1,6 @@
-from ormparams.core.types import LogicExecutor
+from ormparams.core.access import register_access_index
+from ormparams.core.indexes import indexed_columns
+from ormparams.core.types import EagerLoadStrategy, LogicExecutor, RelationshipStrategy
 
 
 class OrmParamsMixin:
@@ -10,3 +12,17 @@ class OrmParamsMixin:
     ORMP_ALLOWED_OPERATIONS = "*"
     ORMP_EXCLUDED_FIELDS: list[str] = []
     ORMP_EXCLUDED_OPERATIONS: list[str] = []
+
+    ORMP_RELATIONSHIP_STRATEGIES: dict[str, RelationshipStrategy] = {}
+    # per-relationship override of OrmParamsPolicy.RELATIONSHIP_STRATEGY
+
+    ORMP_EAGER_LOADING: dict[str, EagerLoadStrategy] = {}
+    # per-relationship loading with OrmParamsPolicy.EAGER_LOADING (see core/loading.py)
+
+    @classmethod
+    def __declare_last__(cls) -> None:
+        # called by SQLAlchemy once mappers are configured:
+        # resolve access rules and indexed columns once per mapped class
+        # (see core/access.py, core/indexes.py)
+        register_access_index(cls)
+        indexed_columns(cls)
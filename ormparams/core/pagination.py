@@ -0,0 +1,102 @@
+import base64
+import binascii
+import enum
+import json
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import and_, literal, or_
+from sqlalchemy.sql import ColumnElement
+
+from ormparams.core.types import SortKey
+
+
+def parse_order_by(value: str) -> List[SortKey]:
+    """
+    Parse a comma separated list of fields, "-" marking descending order.
+
+    [ EXAMPLE ]:
+        "-created_at,name" -> [("created_at", True), ("name", False)]
+    """
+    keys: List[SortKey] = []
+    for raw in value.split(","):
+        name = raw.strip().lstrip("+")
+        if name.startswith("-"):
+            keys.append((name[1:].strip(), True))
+        elif name:
+            keys.append((name, False))
+    return [key for key in keys if key[0]]
+
+
+def _json_default(value: Any) -> Any:
+    # Enum names are what coercion accepts first
+    if isinstance(value, enum.Enum):
+        return value.name
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(keys: Sequence[str], values: Sequence[Any]) -> str:
+    """Opaque cursor: url-safe base64 of {"k": sort fields, "v": their values}."""
+    payload = json.dumps(
+        {"k": list(keys), "v": list(values)},
+        default=_json_default,
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[str]) -> List[Any]:
+    """
+    Return the values stored in `cursor`.
+    Raises ValueError if it is malformed, holds null or non-scalar values or was
+    made for other sort fields.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("malformed cursor") from e
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("k") != list(keys)
+        or not isinstance(payload.get("v"), list)
+        or len(payload["v"]) != len(keys)
+    ):
+        raise ValueError("cursor does not match the sort order")
+
+    values: List[Any] = payload["v"]
+    if not all(isinstance(value, (str, int, float, bool)) for value in values):
+        raise ValueError("malformed cursor, sort values must be non-null scalars")
+    return values
+
+
+def keyset_predicate(
+    columns: Sequence[Any], descending: Sequence[bool], values: Sequence[Any]
+) -> Optional[ColumnElement[bool]]:
+    """
+    Rows strictly after `values` in the given order.
+
+    [ EXAMPLE ]:
+        (a ASC, b DESC, id ASC) after (1, 2, 3):
+            a > 1
+            OR (a = 1 AND b < 2)
+            OR (a = 1 AND b = 2 AND id > 3)
+
+    [ NOTES ]:
+        - Expanded with OR instead of a row-value comparison, so mixed
+          directions work and every backend can use an index on the leading column.
+        - Values are bound with the column type, so e.g. booleans compare as
+          values instead of being taken for SQL constants.
+        - Sort columns are expected to be NOT NULL, NULL sorts differently per
+          backend; cursors holding nulls are rejected by decode_cursor.
+    """
+    bound = [literal(value, column.type) for column, value in zip(columns, values)]
+    branches = []
+    for i, (column, desc, value) in enumerate(zip(columns, descending, bound)):
+        step = column < value if desc else column > value
+        branches.append(
+            and_(*(c == v for c, v in zip(columns[:i], bound[:i])), step) if i else step
+        )
+    return or_(*branches) if branches else None
@@ -1,8 +1,19 @@
-from typing import Annotated, Dict
-from urllib.parse import parse_qsl
+from sys import intern
+from typing import Annotated, FrozenSet, Iterable, Iterator, Mapping, Tuple, Union
 
+from ormparams.core.instrumentation import span
+from ormparams.core.pagination import parse_order_by
 from ormparams.core.policy import OrmParamsPolicy
-from ormparams.core.types import ParsedField, ParsedParam, ParsedResult
+from ormparams.core.projection import parse_field_paths
+from ormparams.core.tokenizer import iter_query_string, tokenize
+from ormparams.core.types import (
+    CompactParsedField,
+    CompactParsedParam,
+    ParsedField,
+    ParsedParam,
+    ParsedParams,
+    ParsedResult,
+)
 
 
 class OrmParamsParser:
@@ -12,12 +23,11 @@ class OrmParamsParser:
     def parse_dict(
         self,
         params_dict: Annotated[
-            Dict[str, str],
+            Mapping[str, str],
             "Dict with keys as fields including relationships and suffixes",
         ],
     ) -> ParsedResult:
-        qsl = "&".join(f"{key}={value}" for key, value in params_dict.items())
-        return self.parse(qsl)
+        return self.parse_items(params_dict.items())
 
     def parse(
         self,
@@ -25,23 +35,99 @@ class OrmParamsParser:
             str, "URL-style query string with parameters, suffixes, and relationships"
         ],
     ) -> ParsedResult:
-        parsed_fields: Dict[str, ParsedField] = {}
+        return self.parse_items(iter_query_string(params))
 
-        for key, raw_value in parse_qsl(params, keep_blank_values=False):
-            rel_parts = key.split(self.policy.RELATIONSHIPS_DELIMITER)
-            relationships = rel_parts[:-1]
+    def parse_items(
+        self,
+        items: Annotated[
+            Iterable[Tuple[str, str]],
+            "Decoded (key, value) pairs, e.g. request.query_params.multi_items()",
+        ],
+    ) -> ParsedResult:
+        """
+        Group parameters by field name. Repeated keys are kept as separate params.
+        Reserved parameters (policy.reserved_params) are stored on the result.
+        """
+        field_type = CompactParsedField if self.policy.COMPACT_PARSED else ParsedField
+        parsed_fields = ParsedParams()
 
-            field_ops = rel_parts[-1].split(self.policy.SUFFIX_DELIMITER)
-            field_name = field_ops[0]
-            operators = field_ops[1:] or ["exact"]
+        with span(self.policy.INSTRUMENTATION, "parse") as counts:
+            reserved = self.policy.reserved_params()
+            if reserved:
+                items = self._take_reserved(items, reserved, parsed_fields)
 
-            if field_name not in parsed_fields:
-                parsed_fields[field_name] = ParsedField(params=[])
+            budget = self.policy.BUDGET
+            n_params = 0
+            for field_name, param in self.iter_params(items):
+                if budget is not None:
+                    budget.check_param(
+                        n_params + 1,
+                        len(param.relationships),
+                        self.policy.EXCEPTION_WRAPPER,
+                    )
+                parsed_field = parsed_fields.get(field_name)
+                if parsed_field is None:
+                    parsed_field = parsed_fields[field_name] = field_type(params=[])
+                parsed_field.params.append(param)  # type: ignore[arg-type]
+                n_params += 1
+
+            counts["params"] = n_params
+            counts["fields"] = len(parsed_fields)
+
+        return parsed_fields
 
-            parsed_fields[field_name].params.append(
-                ParsedParam(
-                    operators=operators, relationships=relationships, value=raw_value
+    def _take_reserved(
+        self,
+        items: Iterable[Tuple[str, str]],
+        reserved: FrozenSet[str],
+        result: ParsedParams,
+    ) -> Iterator[Tuple[str, str]]:
+        """Pass through every pair except reserved ones, which are stored on `result`."""
+        for key, value in items:
+            if key not in reserved:
+                yield key, value
+            elif value:
+                self._set_reserved(result, key, value)
+
+    def _set_reserved(self, result: ParsedParams, key: str, value: str) -> None:
+        if key == self.policy.ORDER_BY_PARAM:
+            result.order_by = tuple(parse_order_by(value))
+        elif key == self.policy.LIMIT_PARAM:
+            try:
+                limit = int(value)
+                if limit < 1:
+                    raise ValueError
+            except ValueError:
+                self.policy.EXCEPTION_WRAPPER.invalid_values(
+                    [(key, value, "expected a positive integer")]
+                )
+            if self.policy.MAX_LIMIT is not None:
+                limit = min(limit, self.policy.MAX_LIMIT)
+            result.limit = limit
+        elif key == self.policy.AFTER_PARAM:
+            result.after = value
+        elif key == self.policy.INCLUDE_PARAM:
+            delimiter = self.policy.RELATIONSHIPS_DELIMITER
+            result.include = tuple(
+                dict.fromkeys(
+                    tuple(intern(name) for name in raw.strip().split(delimiter))
+                    for raw in value.split(",")
+                    if raw.strip()
                 )
             )
+        elif key == self.policy.FIELDS_PARAM:
+            result.fields = tuple(
+                parse_field_paths(value, self.policy.RELATIONSHIPS_DELIMITER)
+            )
 
-        return parsed_fields
+    def iter_params(
+        self, items: Iterable[Tuple[str, str]]
+    ) -> Iterator[Tuple[str, Union[ParsedParam, CompactParsedParam]]]:
+        """Lazily yield (field name, ParsedParam) for each (key, value) pair."""
+        return tokenize(
+            items,
+            self.policy.RELATIONSHIPS_DELIMITER,
+            self.policy.SUFFIX_DELIMITER,
+            self.policy.KEY_CACHE,
+            compact=self.policy.COMPACT_PARSED,
+        )
@@ -0,0 +1,484 @@
+from dataclasses import dataclass
+from functools import cached_property
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from sqlalchemy import and_, bindparam, or_, select
+from sqlalchemy.sql import ColumnElement
+
+from ormparams.core.coercion import Coercer
+from ormparams.core.exceptions import ExceptionWrapper
+from ormparams.core.relationships import JoinStep
+from ormparams.core.suffixes import SuffixSet
+from ormparams.core.types import (
+    CompactParsedParam,
+    LogicExecutor,
+    LogicUnit,
+    ParsedParam,
+    ParsedResult,
+    RelationshipStrategy,
+    SuffixOperatorFunction,
+    SuffixSerializerFunction,
+)
+from ormparams.core.violations import ViolationKey
+
+Violation = Tuple[str, str, Tuple[Any, ...], ViolationKey]
+"""
+Deferred policy violation: (policy reaction attribute, ExceptionWrapper method, args,
+(field, operator, reason) counted by the "aggregate" reaction).
+Replayed through ExceptionWrapper.reactor every time the plan is executed.
+"""
+
+
+@dataclass(frozen=True)
+class OperatorPlan:
+    """
+    One resolved operator of a parameter.
+
+    [ FIELDS ]:
+        - function: operator function taken from the SuffixSet
+        - serializers: suffix serializers, applied before per-request ones
+        - serializer_key: "field__op" key looked up in ParsedField.SERIALIZERS
+        - bind_name: stable bindparam() name, unique per (field, operator, position)
+        - bindable: False if the operator must receive the literal value
+        - coercer: converts serialized values to the column type
+        - coerce: apply `coercer` to literal values too (COERCE_VALUES);
+          bindparam() templates always apply it, see bind_values
+        - operator: suffix name, e.g. "startswith"
+        - takes_value: True if the operator inspects the bound value (takes_policy
+          suffixes); templates hand it a placeholder carrying that value
+    """
+
+    function: SuffixOperatorFunction
+    serializers: Tuple[SuffixSerializerFunction, ...]
+    serializer_key: str
+    bind_name: str
+    bindable: bool = True
+    coercer: Optional[Coercer] = None
+    coerce: bool = True
+    operator: str = ""
+    takes_value: bool = False
+
+
+@dataclass(frozen=True)
+class ParamPlan:
+    """
+    One authorized parameter: target model, resolved column and its operators.
+    `logic` holds exactly len(operators) - 1 combinators.
+
+    [ RELATIONSHIPS ]:
+        - relationships: chain of relationship names from the base model
+        - path: relationship attributes of that chain
+        - strategy: "join" (joined by the plan), "exists" or "in-subquery"
+    """
+
+    model: Any
+    column: Any
+    operators: Tuple[OperatorPlan, ...]
+    logic: Tuple[LogicUnit, ...]
+    relationships: Tuple[str, ...] = ()
+    path: Tuple[Any, ...] = ()
+    strategy: RelationshipStrategy = "join"
+
+    @property
+    def scope(self) -> Optional[Tuple[Tuple[str, ...], RelationshipStrategy]]:
+        """(chain, strategy) if the param is filtered through a subquery."""
+        if self.strategy == "join" or not self.relationships:
+            return None
+        return self.relationships, self.strategy
+
+
+@dataclass(frozen=True)
+class FieldPlan:
+    """
+    All parameters of one field.
+
+    [ NOTES ]:
+        - params is aligned with ParsedField.params; skipped params are None.
+        - logic combines the surviving params, len(survivors) - 1 combinators.
+    """
+
+    name: str
+    params: Tuple[Optional[ParamPlan], ...]
+    logic: Tuple[LogicUnit, ...]
+
+
+@dataclass(frozen=True)
+class FilterPlan:
+    """
+    Compiled, value-free form of a ParsedResult for one model.
+
+    Everything that depends only on the key shape of the query (access rules,
+    suffix lookup, relationship resolution, joins, logic executors) lives here,
+    so executing the plan only has to serialize values and call operators.
+    """
+
+    fields: Tuple[FieldPlan, ...]
+    joins: Tuple[JoinStep, ...]
+    violations: Tuple[Violation, ...]
+
+    def where_clauses(
+        self, parsed: ParsedResult, wrapper: Optional[ExceptionWrapper] = None
+    ) -> List[ColumnElement[Any]]:
+        """
+        Bind the values of `parsed` to the plan as literals.
+
+        [ RETURNS ]:
+            - top-level expressions, each to be applied with .where():
+              one per field, in the order of `parsed`, followed by one subquery
+              per relationship chain filtered with "exists"/"in-subquery".
+        """
+        return self.clauses_for(self.bind_values(parsed, wrapper))
+
+    def clauses_for(self, values: Dict[str, Any]) -> List[ColumnElement[Any]]:
+        """where_clauses for values already returned by bind_values."""
+        return self._build(lambda op: values[op.bind_name])
+
+    def where_template(
+        self, values: Optional[Dict[str, Any]] = None
+    ) -> List[ColumnElement[Any]]:
+        """
+        Same as where_clauses, but values are bindparam() placeholders named
+        after OperatorPlan.bind_name.
+
+        [ NOTES ]:
+            - If every operator is bindable and none takes_value the template is
+              built once per plan and reused, so identical shapes produce the
+              very same statement.
+            - Non-bindable operators take their literal value from `values`.
+            - takes_value operators get bindparam(bind_name, value), so their
+              rendering (e.g. the "in" list strategy) follows the bound value.
+        """
+        if self.bindable and not self.takes_value:
+            return self._template
+        if values is None:
+            raise ValueError(
+                "Values are required for plans with non-bindable operators"
+            )
+
+        def placeholder(op: OperatorPlan) -> Any:
+            if not op.bindable:
+                return values[op.bind_name]
+            if op.takes_value:
+                return bindparam(op.bind_name, values[op.bind_name])
+            return bindparam(op.bind_name)
+
+        return self._build(placeholder)
+
+    @cached_property
+    def bindable(self) -> bool:
+        return all(op.bindable for op in self._operators())
+
+    @cached_property
+    def takes_value(self) -> bool:
+        return any(op.takes_value for op in self._operators())
+
+    @cached_property
+    def joined_paths(self) -> Tuple[Tuple[Any, ...], ...]:
+        """Distinct relationship attribute chains joined by the plan."""
+        paths: Dict[Tuple[Any, ...], None] = {}
+        for field_plan in self.fields:
+            for param in field_plan.params:
+                if param is not None and param.strategy == "join" and param.path:
+                    paths.setdefault(param.path, None)
+        return tuple(paths)
+
+    @cached_property
+    def _template(self) -> List[ColumnElement[Any]]:
+        return self._build(lambda op: bindparam(op.bind_name))
+
+    def bind_values(
+        self,
+        parsed: ParsedResult,
+        wrapper: Optional[ExceptionWrapper] = None,
+        templated: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Run serializers and column-type coercion over the values of `parsed`.
+
+        [ ARGS ]:
+            - templated: values are bound to where_template placeholders, which
+              take the column's type (and bind processor), so bindable operators
+              are coerced even without OperatorPlan.coerce.
+        [ RETURNS ]:
+            - {OperatorPlan.bind_name: serialized value}
+        [ RAISES ]:
+            - InvalidValueError (through `wrapper`) listing every value of the
+              request that could not be coerced, before any SQL is built.
+        """
+        values: Dict[str, Any] = {}
+        errors: List[Tuple[str, Any, str]] = []
+
+        for field_plan, parsed_field in zip(self.fields, parsed.values()):
+            request_serializers = parsed_field.SERIALIZERS
+            field_serializers = (
+                request_serializers.get(field_plan.name) or []
+                if request_serializers
+                else []
+            )
+
+            params: Sequence[Union[ParsedParam, CompactParsedParam]] = (
+                parsed_field.params
+            )
+            for param_plan, param in zip(field_plan.params, params):
+                if param_plan is None:
+                    continue
+
+                value = param.value
+                for op in param_plan.operators:
+                    for serializer in op.serializers:
+                        value = serializer(value)
+                    if request_serializers:
+                        for serializer in field_serializers:
+                            value = serializer(value)
+                        for serializer in (
+                            request_serializers.get(op.serializer_key) or []
+                        ):
+                            value = serializer(value)
+
+                    if op.coercer is None or not (
+                        op.coerce or (templated and op.bindable)
+                    ):
+                        values[op.bind_name] = value
+                        continue
+                    try:
+                        values[op.bind_name] = op.coercer(value)
+                    except (TypeError, ValueError, ArithmeticError) as e:
+                        errors.append((op.serializer_key, value, str(e)))
+
+        if errors:
+            (wrapper or ExceptionWrapper()).invalid_values(errors)
+
+        return values
+
+    def serializer_count(self, parsed: ParsedResult) -> int:
+        """Number of serializer calls bind_values makes for `parsed`."""
+        count = 0
+        for field_plan, parsed_field in zip(self.fields, parsed.values()):
+            request_serializers = parsed_field.SERIALIZERS or {}
+            field_count = len(request_serializers.get(field_plan.name) or [])
+            for param_plan in field_plan.params:
+                if param_plan is None:
+                    continue
+                for op in param_plan.operators:
+                    count += len(op.serializers) + field_count
+                    count += len(request_serializers.get(op.serializer_key) or [])
+        return count
+
+    @property
+    def operators(self) -> List[OperatorPlan]:
+        """Every operator of the plan."""
+        return self._operators()
+
+    @cached_property
+    def param_count(self) -> int:
+        return sum(len(field_plan.params) for field_plan in self.fields)
+
+    @cached_property
+    def max_depth(self) -> int:
+        return max(
+            (
+                len(param.relationships)
+                for field_plan in self.fields
+                for param in field_plan.params
+                if param is not None
+            ),
+            default=0,
+        )
+
+    @cached_property
+    def relationship_hops(self) -> int:
+        """Distinct relationship hops (joined or subqueried) used by the plan."""
+        hops: Set[Tuple[str, ...]] = set()
+        for field_plan in self.fields:
+            for param in field_plan.params:
+                if param is not None:
+                    relationships = param.relationships
+                    hops.update(
+                        relationships[: i + 1] for i in range(len(relationships))
+                    )
+        return len(hops)
+
+    def _operators(self) -> List[OperatorPlan]:
+        return [
+            op
+            for field_plan in self.fields
+            for param_plan in field_plan.params
+            if param_plan is not None
+            for op in param_plan.operators
+        ]
+
+    @cached_property
+    def _field_scopes(
+        self,
+    ) -> List[Optional[Tuple[Tuple[str, ...], RelationshipStrategy]]]:
+        """
+        Subquery scope shared by all params of a field, if any.
+        Such fields are grouped with other fields of the same scope.
+        """
+        scopes: List[Optional[Tuple[Tuple[str, ...], RelationshipStrategy]]] = []
+        for field_plan in self.fields:
+            field_scopes = {p.scope for p in field_plan.params if p is not None}
+            scopes.append(field_scopes.pop() if len(field_scopes) == 1 else None)
+        return scopes
+
+    def _build(
+        self, value_of: Callable[[OperatorPlan], Any]
+    ) -> List[ColumnElement[Any]]:
+        clauses: List[ColumnElement[Any]] = []
+        grouped: Dict[Any, Tuple[ParamPlan, List[ColumnElement[Any]]]] = {}
+
+        for field_plan, scope in zip(self.fields, self._field_scopes):
+            param_exprs: List[ColumnElement[Any]] = []
+            for param_plan in field_plan.params:
+                if param_plan is None:
+                    continue
+
+                expr = combine(
+                    [
+                        op.function(param_plan.column, value_of(op), param_plan.model)
+                        for op in param_plan.operators
+                    ],
+                    param_plan.logic,
+                )
+                if scope is None and param_plan.scope is not None:
+                    expr = wrap_relationship(expr, param_plan.path, param_plan.strategy)
+                param_exprs.append(expr)
+
+            if not param_exprs:
+                continue
+
+            field_expr = combine(param_exprs, field_plan.logic)
+            if scope is None:
+                clauses.append(field_expr)
+                continue
+
+            if scope not in grouped:
+                first = next(p for p in field_plan.params if p is not None)
+                grouped[scope] = (first, [])
+            grouped[scope][1].append(field_expr)
+
+        for param_plan, exprs in grouped.values():
+            clauses.append(
+                wrap_relationship(
+                    and_(*exprs) if len(exprs) > 1 else exprs[0],
+                    param_plan.path,
+                    param_plan.strategy,
+                )
+            )
+
+        return clauses
+
+
+def wrap_relationship(
+    expr: ColumnElement[Any],
+    path: Sequence[Any],
+    strategy: RelationshipStrategy,
+) -> ColumnElement[Any]:
+    """
+    Move `expr` (written against the last model of `path`) into a subquery
+    correlated with the first model of `path`.
+
+    [ STRATEGIES ]:
+        - "exists": rel.any(expr) / rel.has(expr) per hop.
+        - "in-subquery": local_col IN (SELECT remote_col ... WHERE expr) per hop;
+            hops over a secondary table or composite keys fall back to "exists".
+    """
+    for rel_attr in reversed(path):
+        prop = rel_attr.property
+        if (
+            strategy == "in-subquery"
+            and prop.secondary is None
+            and len(prop.local_remote_pairs) == 1
+        ):
+            local, remote = prop.local_remote_pairs[0]
+            expr = local.in_(select(remote).where(expr).correlate(None))
+        else:
+            expr = rel_attr.any(expr) if prop.uselist else rel_attr.has(expr)
+    return expr
+
+
+def logic_sequence(executor: LogicExecutor, n_items: int) -> Tuple[LogicUnit, ...]:
+    """Expand a logic executor into the combinators between n_items expressions."""
+    if isinstance(executor, (list, tuple)):
+        return tuple(executor)
+    return (executor,) * max(n_items - 1, 0)
+
+
+def combine(
+    exprs: Sequence[ColumnElement[Any]], logic: Sequence[LogicUnit]
+) -> ColumnElement[Any]:
+    """
+    Combine expressions left to right: e0 <logic[0]> e1 <logic[1]> e2 ...
+
+    [ NOTES ]:
+        - Consecutive identical combinators are grouped into one n-ary clause:
+            [AND, AND, AND]  -> and_(e0, e1, e2, e3)
+            [OR, AND, AND]   -> and_(or_(e0, e1), e2, e3)
+        - Left-to-right evaluation of mixed lists is kept by nesting runs,
+          instead of folding pairwise (which is quadratic to build).
+    """
+    if len(exprs) == 1:
+        return exprs[0]
+
+    combined = exprs[0]
+    start = 0
+    while start < len(logic) and start + 1 < len(exprs):
+        unit = logic[start]
+        end = start + 1
+        while end < len(logic) and end + 1 < len(exprs) and logic[end] == unit:
+            end += 1
+
+        group = [combined, *exprs[start + 1 : end + 1]]
+        combined = and_(*group) if unit == "AND" else or_(*group)
+        start = end
+
+    return combined
+
+
+def _freeze(value: Optional[Union[str, Sequence[str]]]) -> Hashable:
+    if value is None or isinstance(value, str):
+        return value
+    return tuple(value)
+
+
+def plan_key(
+    model: Any,
+    suffix_set: SuffixSet,
+    suffix_delimiter: str,
+    parsed: ParsedResult,
+    *options: Optional[Union[str, Sequence[str]]],
+) -> Hashable:
+    """
+    Cache key of the key shape of a request: everything a FilterPlan depends on
+    except the values themselves.
+    """
+    return (
+        model,
+        suffix_set,
+        suffix_set.version,
+        suffix_delimiter,
+        tuple(_freeze(option) for option in options),
+        tuple(
+            (
+                field_name,
+                _freeze(parsed_field.PARAMETRIC_LOGIC_EXECUTOR),
+                _freeze(parsed_field.OPERATIONAL_LOGIC_EXECUTOR),
+                tuple(
+                    (tuple(param.relationships), tuple(param.operators))
+                    for param in parsed_field.params
+                ),
+            )
+            for field_name, parsed_field in parsed.items()
+        ),
+    )
@@ -1,10 +1,17 @@
 from dataclasses import dataclass, field
 from logging import Logger
-from typing import Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, FrozenSet, Hashable, Optional
 
+from ormparams.core.budget import QueryBudget
+from ormparams.core.cache import LRUCache
 from ormparams.core.exceptions import ExceptionWrapper
+from ormparams.core.instrumentation import Instrumentation
 from ormparams.core.suffixes import DefaultSuffixSet, SuffixSet
-from ormparams.core.types import PolicyReaction
+from ormparams.core.tokenizer import KeyShape
+from ormparams.core.types import InListStrategy, PolicyReaction, RelationshipStrategy
+
+if TYPE_CHECKING:
+    from ormparams.core.plan import FilterPlan
 
 
 @dataclass
@@ -14,14 +21,168 @@ class OrmParamsPolicy:
     SUFFIX_SET: SuffixSet = field(default_factory=DefaultSuffixSet)
 
     LOGGER: Optional[Logger] = None
+    INSTRUMENTATION: Annotated[
+        Optional[Instrumentation],
+        """
+        Callback (phase, seconds, counts) called after every parse/plan/authorize/
+        join/serialize/build phase, e.g. HistogramCollector(). None disables timing.
+        """,
+    ] = None
     EXCEPTION_WRAPPER: Annotated[
-        ExceptionWrapper, """A wrapper for different situations"""
-    ] = ExceptionWrapper()
+        ExceptionWrapper,
+        """A wrapper for different situations, one per policy (own violation counters)""",
+    ] = field(default_factory=ExceptionWrapper)
 
     EXCLUDED_FIELD: PolicyReaction = "error"
     EXCLUDED_OPERATOR: PolicyReaction = "error"
     NOT_ALLOWED_RELATIONSHIP: PolicyReaction = "error"
 
+    RELATIONSHIP_STRATEGY: Annotated[
+        RelationshipStrategy,
+        """
+        How relationship filters are applied:
+            - "join": JOIN the chain (may multiply rows of one-to-many relationships)
+            - "exists": correlated EXISTS via .any()/.has()
+            - "in-subquery": key IN (SELECT ...)
+        Filters on the same chain share one subquery.
+        Overridable per relationship with ORMP_RELATIONSHIP_STRATEGIES on the model.
+        """,
+    ] = "join"
+
+    COERCE_VALUES: Annotated[
+        bool,
+        """
+        Convert values to the python type of their column (int, date, UUID, ...)
+        after serializers, so the database does not cast the column.
+        All conversion errors of a request are raised together as InvalidValueError.
+        filter_with_params always coerces, its placeholders take the column type.
+        """,
+    ] = False
+
+    IN_LIST_THRESHOLD: Annotated[
+        int,
+        """
+        Max "in" list size always rendered as an expanding bind parameter.
+        Longer lists use IN_LIST_LARGE_STRATEGY.
+        """,
+    ] = 500
+    IN_LIST_LARGE_STRATEGY: Annotated[
+        InListStrategy,
+        """
+        How "in" lists above IN_LIST_THRESHOLD are rendered, chosen when values
+        are bound (also with filter_with_params):
+            - "expanding": column IN (?, ?, ...), one bind parameter per element
+            - "literal": column IN (1, 2, ...), values rendered inline at execution
+              time, no per-element parameters (SQL compile cache still hits)
+            - "array": column = ANY(:arr), a single array parameter (PostgreSQL only)
+        """,
+    ] = "expanding"
+
+    ORDER_BY_PARAM: Annotated[
+        Optional[str], 'Reserved sort parameter: "-created_at,name", None disables it'
+    ] = "_sort"
+    SORT_REQUIRES_INDEX: Annotated[
+        bool,
+        """
+        Only sort by columns leading an index (primary key, __table__.indexes,
+        unique constraints). Other sort keys go through UNINDEXED_SORT.
+        """,
+    ] = False
+    UNINDEXED_SORT: PolicyReaction = "error"
+
+    OPERATORS_REQUIRE_INDEX: Annotated[
+        bool,
+        """
+        Check every (field, operator) pair against the indexes of its model:
+        non index_friendly suffixes (contains, endswith) or columns not leading
+        an index go through UNINDEXED_OPERATOR. The filter is still applied
+        with "warn"/"ignore"/"aggregate".
+        Overridable per filter with OrmParamsFilter(unindexed_operator=...).
+        """,
+    ] = False
+    UNINDEXED_OPERATOR: PolicyReaction = "error"
+    LIMIT_PARAM: Annotated[
+        Optional[str], "Reserved page size parameter, None disables it"
+    ] = "_limit"
+    AFTER_PARAM: Annotated[
+        Optional[str],
+        "Reserved keyset cursor parameter (OrmParamsFilter.next_cursor), None disables it",
+    ] = "_after"
+    FIELDS_PARAM: Annotated[
+        Optional[str],
+        'Reserved projection parameter: "id,name,parent.name", None disables it',
+    ] = "_fields"
+    INCLUDE_PARAM: Annotated[
+        Optional[str],
+        'Reserved eager-loading parameter: "children,parent.children", None disables it',
+    ] = "_include"
+    MAX_LIMIT: Annotated[
+        Optional[int], "Upper bound for LIMIT_PARAM, larger values are clamped"
+    ] = None
+
+    COUNT_ESTIMATE_THRESHOLD: Annotated[
+        Optional[int],
+        """
+        OrmParamsFilter.count returns the planner estimate instead of an exact
+        count when the estimate is at least this many rows (PostgreSQL).
+        None always counts exactly.
+        """,
+    ] = None
+
+    EAGER_LOADING: Annotated[
+        bool,
+        """
+        Eagerly load relationships, avoiding N+1 lazy loads:
+            - joined for filtering -> contains_eager (reuses the JOIN)
+            - listed in INCLUDE_PARAM -> selectinload
+        Overridable per relationship with ORMP_EAGER_LOADING on the model.
+        """,
+    ] = False
+
+    BUDGET: Annotated[
+        Optional[QueryBudget],
+        "Complexity limits checked before any expression is built (see core/budget.py)",
+    ] = None
+
+    COMPACT_PARSED: Annotated[
+        bool,
+        "Parse into CompactParsedField/CompactParsedParam (slotted, tuple-backed)",
+    ] = False
+
+    KEY_CACHE_SIZE: Annotated[
+        int,
+        """
+        Max memoized key decompositions (key -> relationships, field, operators).
+        Clear KEY_CACHE after changing delimiters. 0 disables caching.
+        """,
+    ] = 1024
+    KEY_CACHE: LRUCache[str, KeyShape] = field(init=False, repr=False, compare=False)
+
+    PLAN_CACHE_SIZE: Annotated[
+        int, "Max compiled filter plans kept per policy, 0 disables caching"
+    ] = 256
+    PLAN_CACHE: "LRUCache[Hashable, FilterPlan]" = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.KEY_CACHE = LRUCache(self.KEY_CACHE_SIZE)
+        self.PLAN_CACHE = LRUCache(self.PLAN_CACHE_SIZE)
+
+    def reserved_params(self) -> FrozenSet[str]:
+        """Query keys consumed by the parser instead of being parsed as filters."""
+        return frozenset(
+            name
+            for name in (
+                self.ORDER_BY_PARAM,
+                self.LIMIT_PARAM,
+                self.AFTER_PARAM,
+                self.FIELDS_PARAM,
+                self.INCLUDE_PARAM,
+            )
+            if name
+        )
+
     def get_logger(self) -> Logger:
         """Returns a logger, otherwise throws an error"""
         if self.LOGGER is None:
@@ -0,0 +1,55 @@
+from sys import intern
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy.orm import ColumnProperty, defaultload, load_only
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from ormparams.core.types import FieldPath
+
+
+def parse_field_paths(value: str, relationships_delimiter: str) -> List[FieldPath]:
+    """
+    Parse a comma separated projection, keeping the first occurrence of each field.
+
+    [ EXAMPLE ]:
+        "id,name,parent.name" -> [((), "id"), ((), "name"), (("parent",), "name")]
+    """
+    paths: List[FieldPath] = []
+    for raw in value.split(","):
+        raw = raw.strip()
+        if not raw:
+            continue
+        *relationships, name = raw.split(relationships_delimiter)
+        path = (tuple(intern(r) for r in relationships), intern(name))
+        if name and path not in paths:
+            paths.append(path)
+    return paths
+
+
+def is_column(attribute: Any) -> bool:
+    """True for mapped column attributes (load_only can not take relationships/hybrids)."""
+    return isinstance(getattr(attribute, "property", None), ColumnProperty)
+
+
+def projection_options(
+    columns: Dict[Tuple[Any, ...], List[Any]],
+) -> List[LoaderOption]:
+    """
+    Loader options loading only `columns`, grouped by relationship path.
+
+    [ NOTES ]:
+        - () holds columns of the base model: load_only(...)
+        - Other paths use defaultload(...).load_only(...): relationships keep
+          their loading strategy, only their columns are restricted.
+        - Primary keys are always loaded by the ORM.
+    """
+    options: List[LoaderOption] = []
+    for path, attrs in columns.items():
+        if not path:
+            options.append(load_only(*attrs))
+            continue
+        option = defaultload(path[0])
+        for attr in path[1:]:
+            option = option.defaultload(attr)
+        options.append(option.load_only(*attrs))
+    return options
@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Sequence, Tuple
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Mapper
+
+from ormparams.core.exceptions import ExceptionWrapper
+
+JoinStep = Tuple[Tuple[type, str], Any]
+"""((model, relationship name), relationship attribute to join)"""
+
+PathKey = Tuple[type, Tuple[str, ...]]
+
+
+@dataclass(frozen=True)
+class RelationshipPath:
+    """
+    Resolved chain of relationships.
+
+    [ FIELDS ]:
+        - target: model at the end of the chain
+        - attributes: relationship attribute of every hop
+        - joins: join key and attribute of every hop
+    """
+
+    target: Any
+    attributes: Tuple[Any, ...]
+    joins: Tuple[JoinStep, ...]
+
+
+_paths: "WeakKeyDictionary[Any, Dict[PathKey, RelationshipPath]]" = WeakKeyDictionary()
+
+
+def resolve_path(
+    base_model: Any,
+    relationships: Sequence[str],
+    wrapper: ExceptionWrapper,
+) -> RelationshipPath:
+    """
+    Resolve `relationships` starting at `base_model`.
+
+    Results are cached per registry of `base_model` and dropped whenever
+    mappers are (re)configured. Unknown relationships go through
+    wrapper.field_not_found and are never cached.
+    """
+    registry = inspect(base_model).registry
+    paths = _paths.get(registry)
+    if paths is None:
+        paths = _paths.setdefault(registry, {})
+
+    key = (base_model, tuple(relationships))
+    path = paths.get(key)
+    if path is None:
+        path = paths[key] = _resolve(base_model, key[1], wrapper)
+    return path
+
+
+def _resolve(
+    base_model: Any, relationships: Tuple[str, ...], wrapper: ExceptionWrapper
+) -> RelationshipPath:
+    current_model = base_model
+    attributes = []
+    joins = []
+
+    for rel_name in relationships:
+        attr = getattr(current_model, rel_name, None)
+        if attr is None:
+            wrapper.field_not_found(
+                f"Relationship '{rel_name}' on model {current_model.__name__} not found"
+            )
+
+        prop = getattr(attr, "property", None)
+        if prop is None or not hasattr(prop, "mapper"):
+            wrapper.field_not_found(
+                f"'{rel_name}' on model {current_model.__name__} is not a relationship"
+            )
+
+        attributes.append(attr)
+        joins.append(((current_model, rel_name), attr))
+        current_model = prop.mapper.class_
+
+    return RelationshipPath(
+        target=current_model, attributes=tuple(attributes), joins=tuple(joins)
+    )
+
+
+def clear_relationship_paths() -> None:
+    _paths.clear()
+
+
+@event.listens_for(Mapper, "after_configured")
+def _on_mappers_configured() -> None:
+    clear_relationship_paths()
@@ -1,11 +1,19 @@
-from typing import Any, Dict, Iterable, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union, cast
+
+from sqlalchemy import any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql.elements import BindParameter
 
 from ormparams.core.types import (
+    PolicySuffixOperatorFunction,
     SuffixDefinition,
     SuffixOperatorFunction,
     SuffixSerializerFunction,
 )
 
+if TYPE_CHECKING:
+    from ormparams.core.policy import OrmParamsPolicy
+
 
 class SuffixSet:
     """
@@ -24,14 +32,19 @@ class SuffixSet:
 
     def __init__(self) -> None:
         self._store: Dict[str, SuffixDefinition] = {}
+        self._version = 0
 
     def register(
         self,
         suffix: str,
-        function: SuffixOperatorFunction,
+        function: Union[SuffixOperatorFunction, PolicySuffixOperatorFunction],
         serializers: Optional[
             Union[List[SuffixSerializerFunction], SuffixSerializerFunction]
         ] = None,
+        bindable: bool = True,
+        coerce: bool = True,
+        takes_policy: bool = False,
+        index_friendly: bool = True,
     ) -> None:
         """
         Register or re-register a suffix.
@@ -40,6 +53,15 @@ class SuffixSet:
             - suffix (str): a name for the suffix.
             - function (Callable[column, value, model]): the operator function
             - serializers (optional): optional serializer(s) applied before the operator
+            - bindable (optional): False if the function needs the real value
+                instead of a bindparam() placeholder
+            - coerce (optional): False to keep raw strings when values are
+                coerced to column types (OrmParamsPolicy.COERCE_VALUES)
+            - takes_policy (optional): True if the function is a
+                PolicySuffixOperatorFunction, i.e. accepts a `policy` keyword
+                argument (the OrmParamsPolicy of the filter)
+            - index_friendly (optional): False if an index on the column can not
+                serve the operator (e.g. LIKE '%...')
         """
         if serializers is None:
             serializers = []
@@ -49,8 +71,19 @@ class SuffixSet:
             serializers = [serializers]
 
         self._store[suffix] = SuffixDefinition(
-            function=function, serializers=serializers
+            function=function,
+            serializers=serializers,
+            bindable=bindable,
+            coerce=coerce,
+            takes_policy=takes_policy,
+            index_friendly=index_friendly,
         )
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Incremented on every (re-)registration; compiled filter plans key on it."""
+        return self._version
 
     def get(self, suffix: str) -> SuffixDefinition | None:
         return self._store.get(suffix)
@@ -77,6 +110,48 @@ class SuffixSet:
         return new_set
 
 
+def in_operator(
+    column: Any,
+    value: Any,
+    model: Any,
+    *,
+    policy: Optional["OrmParamsPolicy"] = None,
+) -> Any:
+    """
+    Operator of the default "in" suffix, choosing a strategy by list size.
+
+    [ FLOW ]:
+        - len(value) <= IN_LIST_THRESHOLD, or IN_LIST_LARGE_STRATEGY="expanding":
+            column IN (__[POSTCOMPILE_...]), one bind parameter per element
+        - larger lists, by policy.IN_LIST_LARGE_STRATEGY:
+            - "literal": column IN (1, 2, ...), rendered inline at execution time
+            - "array":  column = ANY(:arr), one array parameter (PostgreSQL)
+
+    [ NOTES ]:
+        - In bindparam() templates `value` is a placeholder carrying the bound
+          list; the returned expression keeps only its name, so the same params
+          apply and shapes rendered the same way compare equal.
+    """
+    if isinstance(value, BindParameter):
+        # template placeholder: decide on the bound list, render only its name
+        items, key, bound, value = value.value, value.key, None, bindparam(value.key)
+    else:
+        items, key, bound = value, None, list(value)
+
+    if (
+        policy is None
+        or items is None
+        or len(items) <= policy.IN_LIST_THRESHOLD
+        or policy.IN_LIST_LARGE_STRATEGY == "expanding"
+    ):
+        return column.in_(value)
+
+    if policy.IN_LIST_LARGE_STRATEGY == "array":
+        return column == any_(bindparam(key, bound, type_=ARRAY(column.type)))
+
+    return column.in_(bindparam(key, bound, expanding=True, literal_execute=True))
+
+
 def DefaultSuffixSet() -> SuffixSet:
     """
     Creates a default set of suffixes.
@@ -90,7 +165,7 @@ def DefaultSuffixSet() -> SuffixSet:
         - contains   -> column.contains(value)
         - startswith -> column.startswith(value)
         - endswith   -> column.endswith(value)
-        - in         -> column.in_(iterable)
+        - in         -> column.in_(iterable), see in_operator for large lists
     """
     s = SuffixSet()
 
@@ -100,9 +175,19 @@ def DefaultSuffixSet() -> SuffixSet:
     s.register("ge", lambda col, v, m: col >= v)
     s.register("lt", lambda col, v, m: col < v)
     s.register("le", lambda col, v, m: col <= v)
-    s.register("contains", lambda col, v, m: col.contains(v))
-    s.register("startswith", lambda col, v, m: col.startswith(v))
-    s.register("endswith", lambda col, v, m: col.endswith(v))
+    s.register(
+        "contains",
+        lambda col, v, m: col.contains(v),
+        coerce=False,
+        index_friendly=False,
+    )
+    s.register("startswith", lambda col, v, m: col.startswith(v), coerce=False)
+    s.register(
+        "endswith",
+        lambda col, v, m: col.endswith(v),
+        coerce=False,
+        index_friendly=False,
+    )
 
     # Serializer for "in" operator
     def in_serializer(v: Any) -> List[Any]:
@@ -114,8 +199,9 @@ def DefaultSuffixSet() -> SuffixSet:
 
     s.register(
         "in",
-        lambda col, v, m: col.in_(v),
+        in_operator,
         serializers=cast(SuffixSerializerFunction, in_serializer),
+        takes_policy=True,
     )
 
     return s
@@ -0,0 +1,96 @@
+from sys import intern
+from typing import Iterable, Iterator, Optional, Tuple, Union
+from urllib.parse import unquote_plus
+
+from ormparams.core.cache import LRUCache
+from ormparams.core.types import CompactParsedParam, ParsedParam
+
+KeyShape = Tuple[Tuple[str, ...], str, Tuple[str, ...]]
+"""(relationships, field name, operators) decomposition of one query key"""
+
+DEFAULT_OPERATORS: Tuple[str, ...] = ("exact",)
+
+
+def _unquote(raw: str) -> str:
+    if "%" in raw or "+" in raw:
+        return unquote_plus(raw)
+    return raw
+
+
+def iter_query_string(query: str) -> Iterator[Tuple[str, str]]:
+    """
+    Scan a raw URL query string once and yield decoded (key, value) pairs.
+
+    [ NOTES ]:
+        - Same decoding as urllib.parse.parse_qsl ("+" -> " ", %XX escapes).
+        - Pairs with a blank value or a blank key are skipped.
+        - Segments are only decoded when they contain "%" or "+".
+    """
+    length = len(query)
+    pos = 0
+    while pos < length:
+        end = query.find("&", pos)
+        if end == -1:
+            end = length
+
+        eq = query.find("=", pos, end)
+        if eq > pos and eq + 1 < end:
+            yield _unquote(query[pos:eq]), _unquote(query[eq + 1 : end])
+
+        pos = end + 1
+
+
+def split_key(
+    key: str, relationships_delimiter: str, suffix_delimiter: str
+) -> KeyShape:
+    """
+    Decompose a query key into interned names.
+
+    [ EXAMPLE ]:
+        "parent.name__startswith" -> (("parent",), "name", ("startswith",))
+        "name"                    -> ((), "name", ("exact",))
+    """
+    *relationships, tail = key.split(relationships_delimiter)
+    field_name, *operators = tail.split(suffix_delimiter)
+    return (
+        tuple(intern(name) for name in relationships),
+        intern(field_name),
+        tuple(intern(op) for op in operators) or DEFAULT_OPERATORS,
+    )
+
+
+def tokenize(
+    items: Iterable[Tuple[str, str]],
+    relationships_delimiter: str,
+    suffix_delimiter: str,
+    shapes: Optional[LRUCache[str, KeyShape]] = None,
+    compact: bool = False,
+) -> Iterator[Tuple[str, Union[ParsedParam, CompactParsedParam]]]:
+    """
+    Lazily turn (key, value) pairs into (field name, ParsedParam).
+    Pairs with a blank value are skipped, same as in query strings.
+
+    [ ARGS ]:
+        - shapes (optional): memo of key -> split_key(key), shared between requests
+        - compact (optional): yield CompactParsedParam sharing the cached tuples
+    """
+    for key, value in items:
+        if value is None or value == "":
+            continue
+
+        shape = shapes.get(key) if shapes is not None else None
+        if shape is None:
+            shape = split_key(key, relationships_delimiter, suffix_delimiter)
+            if shapes is not None:
+                shapes.set(key, shape)
+
+        relationships, field_name, operators = shape
+        if compact:
+            yield field_name, CompactParsedParam(operators, relationships, value)
+            continue
+
+        yield field_name, ParsedParam(
+            operators=list(operators),
+            relationships=list(relationships),
+            value=value,
+        )
@@ -1,17 +1,25 @@
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import (
     Annotated,
     Any,
     Dict,
     List,
     Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
     Protocol,
+    Tuple,
     Union,
 )
 
 from sqlalchemy.orm import DeclarativeBase, InstrumentedAttribute
 
-PolicyReaction = Literal["error", "warn", "ignore"]
+PolicyReaction = Literal["error", "warn", "ignore", "aggregate"]
+RelationshipStrategy = Literal["join", "exists", "in-subquery"]
+InListStrategy = Literal["expanding", "literal", "array"]
+EagerLoadStrategy = Literal["contains", "selectin", "none"]
 
 
 class SuffixOperatorFunction(Protocol):
@@ -25,23 +33,51 @@ class SuffixOperatorFunction(Protocol):
     ) -> Any: ...
 
 
+class PolicySuffixOperatorFunction(Protocol):
+    """Operator of a takes_policy suffix, also given the filter's OrmParamsPolicy."""
+
+    def __call__(
+        self,
+        column: Annotated[InstrumentedAttribute[Any], "Column to compare with"],
+        value: Annotated[Any, "User-provided value"],
+        model: Annotated[DeclarativeBase, "Model context for advanced filtering"],
+        *,
+        policy: Annotated[Any, "OrmParamsPolicy of the filter"],
+    ) -> Any: ...
+
+
 class SuffixSerializerFunction(Protocol):
     """Callable that transforms/casts the raw value."""
 
     def __call__(self, value: Annotated[Any, "Raw value to be transformed"]) -> Any: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class SuffixDefinition:
     """
     Definition of one suffix: operator + serializers.
 
     [ NOTE ]:
         -! Serializers are executed in the order they appear in the list.
+        -! bindable=False marks operators that inspect the value in Python
+           (e.g. `col.is_(None) if v else ...`); they always get the literal
+           value, even when statements are built with bind parameters.
+        -! coerce=False keeps raw strings even with OrmParamsPolicy.COERCE_VALUES
+           (e.g. LIKE-style operators).
+        -! takes_policy=True passes the filter's policy to the function as the
+           `policy` keyword argument (a PolicySuffixOperatorFunction, e.g. the
+           "in" list-size thresholds). In bindparam() templates such functions
+           get a placeholder carrying the bound value, so they can inspect it.
+        -! index_friendly=False marks operators a B-tree index can not serve
+           (e.g. leading-wildcard LIKE), see OrmParamsPolicy.OPERATORS_REQUIRE_INDEX.
     """
 
-    function: SuffixOperatorFunction
+    function: Union[SuffixOperatorFunction, PolicySuffixOperatorFunction]
     serializers: List[SuffixSerializerFunction]
+    bindable: bool = True
+    coerce: bool = True
+    takes_policy: bool = False
+    index_friendly: bool = True
 
 
 @dataclass
@@ -130,7 +166,7 @@ class ParsedField:
     ] = field(default="AND")
 
     SERIALIZERS: Annotated[
-        Dict[str, SuffixSerializerFunction],
+        Dict[str, List[SuffixSerializerFunction]],
         """
         Dictionary, where a key is:
             - a pure field ({"age": [...]})
@@ -144,8 +180,74 @@ class ParsedField:
     ] = field(default_factory=dict)
 
 
+EMPTY_SERIALIZERS: Mapping[str, List[SuffixSerializerFunction]] = MappingProxyType({})
+"""Shared read-only SERIALIZERS of compact fields, replaced on first apply_serializer."""
+
+
+class CompactParsedParam(NamedTuple):
+    """
+    Tuple-backed ParsedParam with the same attribute names.
+    operators/relationships are tuples shared with the parser's key cache.
+    """
+
+    operators: Tuple[str, ...]
+    relationships: Tuple[str, ...]
+    value: str
+
+
+@dataclass(slots=True)
+class CompactParsedField:
+    """
+    Slotted ParsedField with the same attribute names.
+
+    [ NOTES ]:
+        - SERIALIZERS defaults to the shared EMPTY_SERIALIZERS instead of a new dict.
+        - Enabled with OrmParamsPolicy(COMPACT_PARSED=True).
+    """
+
+    params: List[CompactParsedParam] = field(default_factory=list)
+    PARAMETRIC_LOGIC_EXECUTOR: LogicExecutor = "AND"
+    OPERATIONAL_LOGIC_EXECUTOR: LogicExecutor = "AND"
+    SERIALIZERS: Mapping[str, List[SuffixSerializerFunction]] = field(
+        default_factory=lambda: EMPTY_SERIALIZERS
+    )
+
+
+SortKey = Tuple[str, bool]
+"""(field name, descending)"""
+
+FieldPath = Tuple[Tuple[str, ...], str]
+"""(relationship chain, field name), e.g. "parent.name" -> (("parent",), "name")"""
+
+
+class ParsedParams(Dict[str, Union[ParsedField, CompactParsedField]]):
+    """
+    ParsedResult returned by OrmParamsParser, carrying the reserved parameters.
+
+    [ FIELDS ]:
+        - order_by: sort keys of OrmParamsPolicy.ORDER_BY_PARAM ("_sort=-created_at,name")
+        - limit: page size of OrmParamsPolicy.LIMIT_PARAM
+        - after: opaque cursor of OrmParamsPolicy.AFTER_PARAM
+        - fields: projection of OrmParamsPolicy.FIELDS_PARAM ("id,name,parent.name")
+        - include: relationship chains of OrmParamsPolicy.INCLUDE_PARAM ("children,parent.children")
+
+    [ NOTES ]:
+        - Plain dicts are still accepted by OrmParamsFilter, without paging.
+    """
+
+    __slots__ = ("order_by", "limit", "after", "fields", "include")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.order_by: Tuple[SortKey, ...] = ()
+        self.limit: Optional[int] = None
+        self.after: Optional[str] = None
+        self.fields: Tuple[FieldPath, ...] = ()
+        self.include: Tuple[Tuple[str, ...], ...] = ()
+
+
 ParsedResult = Annotated[
-    Dict[str, ParsedField],
+    Dict[str, Union[ParsedField, CompactParsedField]],
     """
     Dictionary mapping each field mentioned in the parameters to a ParsedField.
 
@@ -0,0 +1,67 @@
+import threading
+from logging import Logger
+from time import monotonic
+from typing import Callable, Dict, Optional, Tuple
+
+ViolationKey = Tuple[str, str, str]
+"""(field, operator, reason), reason being the ExceptionWrapper method name"""
+
+
+class ViolationAggregator:
+    """
+    Counts policy violations with the "aggregate" reaction instead of raising.
+
+    [ NOTES ]:
+        - No exception is created per violation, recording is a dict increment.
+        - At most one summary is logged per `interval` seconds, listing the
+          `top` most frequent (field, operator, reason) since the last summary.
+        - counts() returns totals since creation (or reset()).
+        - Thread-safe.
+    """
+
+    def __init__(self, interval: float = 60.0, top: int = 20) -> None:
+        self.interval = interval
+        self.top = top
+        self._lock = threading.Lock()
+        self._totals: Dict[ViolationKey, int] = {}
+        self._pending: Dict[ViolationKey, int] = {}
+        self._last_summary = monotonic()
+
+    def record(
+        self, key: ViolationKey, logger: Optional[Callable[[], Logger]] = None
+    ) -> None:
+        """Count `key`; log a summary through `logger` once the interval has passed."""
+        with self._lock:
+            self._totals[key] = self._totals.get(key, 0) + 1
+            self._pending[key] = self._pending.get(key, 0) + 1
+
+            now = monotonic()
+            if logger is None or now - self._last_summary < self.interval:
+                return
+            pending, self._pending = self._pending, {}
+            self._last_summary = now
+
+        logger().warning(self.summary(pending))
+
+    def summary(self, counts: Optional[Dict[ViolationKey, int]] = None) -> str:
+        """One line per (field, operator, reason), most frequent first."""
+        if counts is None:
+            counts = self.counts()
+        ranked = sorted(counts.items(), key=lambda item: item[1], reverse=True)
+        lines = [
+            f"  {reason} field={field!r} operator={operator!r}: {n}"
+            for (field, operator, reason), n in ranked[: self.top]
+        ]
+        if len(ranked) > self.top:
+            lines.append(f"  ... {len(ranked) - self.top} more")
+        return f"{sum(counts.values())} policy violations:\n" + "\n".join(lines)
+
+    def counts(self) -> Dict[ViolationKey, int]:
+        with self._lock:
+            return dict(self._totals)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._totals.clear()
+            self._pending.clear()
+            self._last_summary = monotonic()
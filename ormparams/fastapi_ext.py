@@ -3,21 +3,29 @@ from __future__ import annotations
 from collections.abc import Iterable
 from typing import (
     Annotated,
+    Any,
+    Awaitable,
     Callable,
+    Dict,
+    List,
     Optional,
     Self,
     Sequence,
+    Tuple,
     Type,
     Union,
+    cast,
 )
 
 from fastapi import FastAPI, Request
+from sqlalchemy import Select
 from sqlalchemy.orm import DeclarativeMeta
 
+from ormparams.core.filter import OrmParamsFilter
 from ormparams.core.parser import OrmParamsParser
 from ormparams.core.policy import OrmParamsPolicy
 from ormparams.core.suffixes import DefaultSuffixSet, SuffixSet
-from ormparams.core.types import ParsedResult
+from ormparams.core.types import ParsedResult, PolicyReaction
 
 
 class OrmParamsFastAPI:
@@ -54,42 +62,122 @@ class OrmParamsFastAPI:
         *,
         include: Optional[Sequence[str]] = None,
     ) -> Callable[[Request], ParsedResult]:
+        accepted_keys = self._accepted_keys(model, include)
+
         async def _dependency(request: Request) -> ParsedResult:
-            if self.parser is None or self.policy is None:
-                raise RuntimeError(
-                    "OrmParamsFastAPI not initialized. Call init_app() first."
-                )
+            return self._parse_request(request, accepted_keys)
 
-            models: list[Type[DeclarativeMeta]] = (
-                [model]
-                if isinstance(model, type)
-                else list(model) if isinstance(model, Iterable) else []
-            )
+        return _dependency
 
-            include_: set[str] = set(include or [])
-            query_dict = dict(request.query_params)
-            valid_columns: set[str] = {
-                c.key for m in models for c in m.__table__.columns
-            }
-
-            suffix_delim = self.policy.SUFFIX_DELIMITER
-            rel_delim = self.policy.RELATIONSHIPS_DELIMITER
-
-            filtered_query = {
-                k: v
-                for k, v in query_dict.items()
-                if (
-                    suffix_delim in k
-                    or rel_delim in k
-                    or k in valid_columns
-                    or k in include_
+    def get_query(
+        self,
+        model: Annotated[Type[DeclarativeMeta], "Model the statement selects"],
+        *,
+        query: Optional[Select[Any]] = None,
+        include: Optional[Sequence[str]] = None,
+        with_params: bool = False,
+        allowed_relationships: Optional[List[str]] = None,
+        allowed_fields: Optional[List[str]] = None,
+        allowed_operations: Optional[List[str]] = None,
+        excluded_fields: Optional[List[str]] = None,
+        excluded_operations: Optional[List[str]] = None,
+        unindexed_operator: Optional[PolicyReaction] = None,
+    ) -> Callable[
+        [Request], Awaitable[Union[Select[Any], Tuple[Select[Any], Dict[str, Any]]]]
+    ]:
+        """
+        Dependency returning the filtered statement of the request.
+
+        [ EXAMPLE ]:
+            @app.get("/parents")
+            async def get_parents(
+                query=Depends(ormparams.get_query(Parent, allowed_relationships=["children"])),
+            ):
+                return db.execute(query).scalars().all()
+
+        [ NOTES ]:
+            - Accepted keys and one shared OrmParamsFilter are set up once per route;
+              compiled plans come from policy.PLAN_CACHE, so a request only
+              parses and binds its values.
+            - with_params=True returns (statement, params) from filter_with_params,
+              keeping the SQL text identical for requests of the same key shape.
+            - Relationship keys are always passed on, allowed_relationships decides.
+            - unindexed_operator sets the reaction to filters no index can serve
+              for this route (see OrmParamsPolicy.OPERATORS_REQUIRE_INDEX).
+        """
+        accepted_keys = self._accepted_keys(model, include)
+        shared: Optional[OrmParamsFilter] = None
+
+        async def _dependency(
+            request: Request,
+        ) -> Union[Select[Any], Tuple[Select[Any], Dict[str, Any]]]:
+            nonlocal shared
+            parsed = self._parse_request(request, accepted_keys)
+
+            if shared is None or shared.policy is not self.policy:
+                shared = OrmParamsFilter(
+                    cast(OrmParamsPolicy, self.policy),
+                    model=cast(Any, model),
+                    query=query,
+                    unindexed_operator=unindexed_operator,
                 )
-            }
 
-            return self.parser.parse_dict(filtered_query)
+            if with_params:
+                return shared.filter_with_params(
+                    parsed=parsed,
+                    allowed_relationships=allowed_relationships,
+                    allowed_fields=allowed_fields,
+                    allowed_operations=allowed_operations,
+                    excluded_fields=excluded_fields,
+                    excluded_operations=excluded_operations,
+                )
+            return shared.filter(
+                parsed=parsed,
+                allowed_relationships=allowed_relationships,
+                allowed_fields=allowed_fields,
+                allowed_operations=allowed_operations,
+                excluded_fields=excluded_fields,
+                excluded_operations=excluded_operations,
+            )
 
         return _dependency
 
+    @staticmethod
+    def _accepted_keys(
+        model: Union[Type[DeclarativeMeta], Sequence[Type[DeclarativeMeta]]],
+        include: Optional[Sequence[str]],
+    ) -> frozenset[str]:
+        """Plain keys (no delimiters) kept for parsing: model columns and `include`."""
+        models: list[Type[DeclarativeMeta]] = (
+            [model]
+            if isinstance(model, type)
+            else list(model) if isinstance(model, Iterable) else []
+        )
+        return frozenset(c.key for m in models for c in m.__table__.columns) | (
+            frozenset(include or [])
+        )
+
+    def _parse_request(
+        self, request: Request, accepted_keys: frozenset[str]
+    ) -> ParsedResult:
+        if self.parser is None or self.policy is None:
+            raise RuntimeError(
+                "OrmParamsFastAPI not initialized. Call init_app() first."
+            )
+
+        suffix_delim = self.policy.SUFFIX_DELIMITER
+        rel_delim = self.policy.RELATIONSHIPS_DELIMITER
+        reserved = self.policy.reserved_params()
+
+        return self.parser.parse_items(
+            (k, v)
+            for k, v in request.query_params.multi_items()
+            if k in accepted_keys
+            or suffix_delim in k
+            or rel_delim in k
+            or k in reserved
+        )
+
     def __call__(self) -> Self:
         if self.parser is None:
             raise RuntimeError(
@@ -0,0 +1,90 @@
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+import datetime
+
+from sqlalchemy import Boolean, Column, Date, Integer, String, create_engine
+from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy.pool import StaticPool
+
+from ormparams.fastapi_ext import OrmParamsFastAPI
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = "items"
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    active = Column(Boolean)
+    released = Column(Date)
+
+
+def make_client(**kwargs):
+    app = FastAPI()
+    ormp = OrmParamsFastAPI()
+    ormp.init_app(app)
+
+    @app.get("/items")
+    def items(parsed=Depends(ormp.get_params(Item, **kwargs))):
+        return {
+            field: [(p.operators, p.value) for p in parsed_field.params]
+            for field, parsed_field in parsed.items()
+        }
+
+    return TestClient(app)
+
+
+def test_get_params_keeps_repeated_keys_and_drops_unknown():
+    response = make_client().get(
+        "/items", params=[("id__gt", "1"), ("id__gt", "2"), ("page", "3")]
+    )
+    assert response.json() == {"id": [[["gt"], "1"], [["gt"], "2"]]}
+
+
+def test_get_params_include():
+    response = make_client(include=["page"]).get("/items?page=3&name=a%20b")
+    assert response.json() == {
+        "page": [[["exact"], "3"]],
+        "name": [[["exact"], "a b"]],
+    }
+
+
+def test_get_query_returns_statement_or_params():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [
+                Item(name="a", active=True, released=datetime.date(2019, 1, 1)),
+                Item(name="b", active=False, released=datetime.date(2019, 6, 1)),
+                Item(name="c", active=True, released=datetime.date(2020, 1, 1)),
+            ]
+        )
+        session.commit()
+
+    app = FastAPI()
+    ormp = OrmParamsFastAPI()
+    ormp.init_app(app)
+
+    @app.get("/items")
+    def items(query=Depends(ormp.get_query(Item, excluded_operations=["lt"]))):
+        with Session(engine) as session:
+            return [item.name for item in session.execute(query).scalars()]
+
+    @app.get("/bound")
+    def bound(stmt=Depends(ormp.get_query(Item, with_params=True))):
+        query, params = stmt
+        with Session(engine) as session:
+            return [item.name for item in session.execute(query, params).scalars()]
+
+    client = TestClient(app)
+    assert client.get("/items").json() == ["a", "b", "c"]
+    assert client.get("/items?id__gt=1&page=2").json() == ["b", "c"]
+    assert client.get("/bound?name__in=a,c").json() == ["a", "c"]
+    assert client.get("/bound?active=true").json() == ["a", "c"]
+    assert client.get("/bound?released__ge=2019-06-01").json() == ["b", "c"]
+    assert ormp.policy.PLAN_CACHE.info().currsize == 5
@@ -0,0 +1,743 @@
+import logging
+
+import pytest
+import datetime
+
+from sqlalchemy import Boolean, Column, Date, ForeignKey, Integer, String, create_engine
+from sqlalchemy.orm import Session, declarative_base, relationship
+
+from ormparams.core.filter import OrmParamsFilter
+from ormparams.core.mixin import OrmParamsMixin
+from ormparams.core.parser import OrmParamsParser
+from ormparams.core.policy import OrmParamsPolicy
+
+Base = declarative_base()
+
+
+class Parent(Base, OrmParamsMixin):
+    __tablename__ = "parents"
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    children = relationship("Child", back_populates="parent")
+
+
+class Child(Base, OrmParamsMixin):
+    __tablename__ = "children"
+    ORMP_ALLOWED_OPERATIONS = ["exact", "startswith", "in"]
+
+    id = Column(Integer, primary_key=True)
+    parent_id = Column(Integer, ForeignKey("parents.id"))
+    value = Column(String)
+    parent = relationship("Parent", back_populates="children")
+
+
+class Event(Base, OrmParamsMixin):
+    __tablename__ = "events"
+    id = Column(Integer, primary_key=True)
+    flag = Column(Boolean)
+    born = Column(Date)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as sess:
+        alice = Parent(name="Alice")
+        bob = Parent(name="Bob")
+        sess.add_all(
+            [
+                alice,
+                bob,
+                Child(value="C1", parent=alice),
+                Child(value="C2", parent=alice),
+                Child(value="C3", parent=bob),
+            ]
+        )
+        sess.commit()
+        yield sess
+
+
+@pytest.fixture
+def policy():
+    return OrmParamsPolicy(LOGGER=logging.getLogger("ormparams-test"))
+
+
+@pytest.fixture
+def parser(policy):
+    return OrmParamsParser(policy)
+
+
+def names(session, query):
+    query, params = query if isinstance(query, tuple) else (query, None)
+    return sorted(p.name for p in session.execute(query, params).scalars().unique())
+
+
+def test_plan_is_reused_for_same_key_shape(session, policy, parser):
+    for name in ("Alice", "Bob"):
+        parsed = parser.parse(f"name={name}&children.value__startswith=C")
+        query = OrmParamsFilter(policy, model=Parent, parsed=parsed).filter(
+            allowed_relationships=["children"]
+        )
+        assert names(session, query) == [name]
+
+    info = policy.PLAN_CACHE.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_plan_key_depends_on_shape(policy, parser):
+    for qs in ("id__gt=1", "id__lt=1", "id__gt=1&name=x", "id__gt=1&id__lt=5"):
+        OrmParamsFilter(policy, model=Parent, parsed=parser.parse(qs)).filter()
+
+    assert policy.PLAN_CACHE.info().currsize == 4
+
+
+def test_cached_plan_replays_violations(session, policy, parser, caplog):
+    policy.EXCLUDED_OPERATOR = "warn"
+
+    for _ in range(2):
+        parsed = parser.parse("children.value__endswith=1&children.value=C3")
+        query = OrmParamsFilter(policy, model=Parent, parsed=parsed).filter(
+            allowed_relationships=["children"]
+        )
+        assert names(session, query) == ["Bob"]
+
+    assert policy.PLAN_CACHE.info().hits == 1
+    assert caplog.text.count("'endswith' is not allowed") == 2
+
+
+def test_filter_with_params_reuses_template(session, policy, parser):
+    statements = []
+    for name, ids in (("Alice", "1,2"), ("Bob", "2")):
+        parsed = parser.parse(f"name={name}&id__in={ids}")
+        query, params = OrmParamsFilter(
+            policy, model=Parent, parsed=parsed
+        ).filter_with_params()
+        statements.append(query)
+
+        assert params == {
+            "name_exact_0": name,
+            "id_in_1": [int(i) for i in ids.split(",")],
+        }
+        assert names(session, (query, params)) == [name]
+
+    assert statements[0].whereclause.compare(statements[1].whereclause)
+    assert str(statements[0]) == str(statements[1])
+
+
+def test_filter_with_params_binds_typed_columns(session, policy, parser):
+    session.add_all(
+        [
+            Event(flag=True, born=datetime.date(2000, 1, 1)),
+            Event(flag=False, born=datetime.date(2001, 1, 1)),
+        ]
+    )
+    session.commit()
+
+    f = OrmParamsFilter(policy, model=Event)
+    for qs, expected in (("flag=true", [1]), ("born__ge=2000-06-01", [2])):
+        parsed = parser.parse(qs)
+        query, params = f.filter_with_params(parsed=parsed)
+        assert session.execute(query, params).scalars().all() == [
+            session.get(Event, i) for i in expected
+        ]
+
+
+def test_filter_with_params_keeps_non_bindable_literal(session, policy, parser):
+    policy.SUFFIX_SET.register(
+        "isnull",
+        lambda col, v, m: col.is_(None) if v else col.is_not(None),
+        serializers=lambda v: v.lower() in ("true", "1"),
+        bindable=False,
+    )
+    parsed = parser.parse("name__isnull=false")
+    query, _ = OrmParamsFilter(policy, model=Parent, parsed=parsed).filter_with_params()
+
+    assert "IS NOT NULL" in str(query)
+
+
+def test_compact_parsed_result_filters_the_same(session):
+    policy = OrmParamsPolicy(COMPACT_PARSED=True)
+    parsed = OrmParamsParser(policy).parse("children.value__in=c1,C3")
+
+    field = parsed["value"]
+    assert not hasattr(field, "__dict__")
+    assert field.params[0].operators == ("in",)
+    assert field.params[0].relationships == ("children",)
+
+    f = OrmParamsFilter(policy, model=Parent, parsed=parsed).apply_serializer(
+        "value", lambda v: [x.upper() for x in v]
+    )
+    query = f.filter(allowed_relationships=["children"])
+
+    assert names(session, query) == ["Alice", "Bob"]
+    assert OrmParamsParser(policy).parse("value=x")["value"].SERIALIZERS == {}
+
+
+def test_combine_groups_runs_and_keeps_left_to_right_order():
+    import random
+
+    from sqlalchemy import and_, literal, or_, select
+
+    from ormparams.core.plan import combine
+
+    a, b, c, d = (Parent.id == i for i in range(4))
+    expr = combine([a, b, c, d], ["OR", "AND", "AND"])
+    assert expr.compare(and_(or_(a, b), c, d))
+    assert combine([a, b, c], ["AND", "AND"]).compare(and_(a, b, c))
+
+    engine = create_engine("sqlite://")
+    rng = random.Random(0)
+    with engine.connect() as conn:
+        for _ in range(50):
+            bits = [rng.random() < 0.5 for _ in range(6)]
+            logic = [rng.choice(["AND", "OR"]) for _ in range(5)]
+
+            expected = bits[0]
+            for unit, bit in zip(logic, bits[1:]):
+                expected = (expected and bit) if unit == "AND" else (expected or bit)
+
+            exprs = [literal(1) == int(bit) for bit in bits]
+            stmt = select(combine(exprs, logic))
+            assert bool(conn.execute(stmt).scalar()) is expected
+
+
+@pytest.mark.parametrize("strategy", ["exists", "in-subquery"])
+def test_subquery_strategies_do_not_multiply_rows(session, parser, strategy):
+    policy = OrmParamsPolicy(RELATIONSHIP_STRATEGY=strategy)
+    parsed = OrmParamsParser(policy).parse(
+        "children.value__startswith=C&children.id__in=1,2,3&name__in=Alice,Bob"
+    )
+    query = OrmParamsFilter(policy, model=Parent, parsed=parsed).filter(
+        allowed_relationships=["children"]
+    )
+
+    sql = str(query)
+    assert "JOIN" not in sql
+    assert sql.count("EXISTS" if strategy == "exists" else "IN (SELECT") == 1
+    assert sorted(p.name for p in session.execute(query).scalars()) == ["Alice", "Bob"]
+
+
+def test_relationship_strategy_per_model(session, policy, parser, monkeypatch):
+    monkeypatch.setattr(
+        Child, "ORMP_RELATIONSHIP_STRATEGIES", {"parent": "exists"}, raising=False
+    )
+    parsed = parser.parse("parent.children.value=C3&value__in=C2,C3")
+    query = OrmParamsFilter(policy, model=Child, parsed=parsed).filter(
+        allowed_relationships=["parent", "children"]
+    )
+
+    assert "JOIN" not in str(query)
+    assert [c.value for c in session.execute(query).scalars()] == ["C3"]
+
+
+def test_shared_filter_joins_on_every_call(session, policy, parser):
+    shared = OrmParamsFilter(policy, model=Parent)
+
+    for value in ("C1", "C3"):
+        parsed = parser.parse(f"children.value={value}")
+        query = shared.filter(parsed=parsed, allowed_relationships=["children"])
+        assert "JOIN children" in str(query)
+
+    assert names(session, query) == ["Bob"]
+
+
+def test_shared_filter_is_thread_safe(policy, parser):
+    from concurrent.futures import ThreadPoolExecutor
+
+    shared = OrmParamsFilter(policy, model=Parent)
+    query_strings = [
+        "name=Alice",
+        "children.value=C1",
+        "children.value__startswith=C&name__in=Alice,Bob",
+        "id__gt=1&children.id__in=1,3",
+    ] * 50
+
+    def run(qs):
+        return str(
+            shared.filter(parsed=parser.parse(qs), allowed_relationships=["children"])
+        )
+
+    expected = {
+        qs: str(
+            OrmParamsFilter(policy, model=Parent, parsed=parser.parse(qs)).filter(
+                allowed_relationships=["children"]
+            )
+        )
+        for qs in set(query_strings)
+    }
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(run, query_strings))
+
+    assert results == [expected[qs] for qs in query_strings]
+
+
+def test_access_index_is_built_once_per_mapped_class():
+    from sqlalchemy.orm import configure_mappers
+
+    from ormparams.core.access import get_access_index
+
+    configure_mappers()
+    index = get_access_index(Child)
+
+    assert get_access_index(Child) is index
+    assert index.allowed_operations == {"exact", "startswith", "in"}
+    assert index.allows("value", "in") and not index.allows("value", "gt")
+    assert index.column("value") is Child.value
+
+
+def test_excluded_operations_apply_with_wildcard(policy, parser, monkeypatch):
+    from ormparams.core.access import clear_access_indexes
+    from ormparams.core.exceptions import ExcludedOperatorError, FieldNotFoundError
+
+    monkeypatch.setattr(Parent, "ORMP_EXCLUDED_OPERATIONS", ["contains"])
+    clear_access_indexes()
+
+    f = OrmParamsFilter(policy, model=Parent)
+    with pytest.raises(ExcludedOperatorError):
+        f.filter(parsed=parser.parse("name__contains=A"))
+    with pytest.raises(FieldNotFoundError):
+        f.filter(parsed=parser.parse("nickname=A"))
+    clear_access_indexes()
+
+
+def test_relationship_paths_are_cached_until_mappers_reconfigure(policy):
+    from sqlalchemy.orm import configure_mappers
+
+    from ormparams.core.relationships import resolve_path
+
+    configure_mappers()
+    path = resolve_path(Child, ["parent", "children"], policy.EXCEPTION_WRAPPER)
+
+    assert path.target is Child
+    assert path.attributes == (Child.parent, Parent.children)
+    assert resolve_path(Child, ("parent", "children"), policy.EXCEPTION_WRAPPER) is path
+    assert OrmParamsFilter(policy).get_relationships_model(["parent"], Child) is Parent
+
+    class Toy(Base):
+        __tablename__ = "toys"
+        id = Column(Integer, primary_key=True)
+        child_id = Column(Integer, ForeignKey("children.id"))
+        child = relationship("Child")
+
+    configure_mappers()
+    assert (
+        resolve_path(Child, ["parent", "children"], policy.EXCEPTION_WRAPPER)
+        is not path
+    )
+
+
+def test_values_are_coerced_to_column_types(session):
+    from ormparams.core.exceptions import InvalidValueError
+
+    policy = OrmParamsPolicy(COERCE_VALUES=True)
+    coercing = OrmParamsParser(policy)
+
+    f = OrmParamsFilter(policy, model=Parent)
+    query, params = f.filter_with_params(parsed=coercing.parse("id__in=1,2&id__ge=2"))
+    assert params == {"id_in_0": [1, 2], "id_ge_1": 2}
+    assert names(session, (query, params)) == ["Bob"]
+
+    with pytest.raises(InvalidValueError) as exc:
+        f.filter(parsed=coercing.parse("id__in=1,x&id__gt=abc&name=1"))
+    assert [key for key, _, _ in exc.value.errors] == ["id__in", "id__gt"]
+
+
+def test_large_in_lists_switch_strategy(session):
+    from sqlalchemy.dialects import postgresql
+
+    policy = OrmParamsPolicy(IN_LIST_THRESHOLD=2, COERCE_VALUES=True)
+    parser = OrmParamsParser(policy)
+    f = OrmParamsFilter(policy, model=Parent)
+    ids = ",".join(str(i) for i in [1, 3] + list(range(10, 1000)))
+
+    large = f.filter(parsed=parser.parse(f"id__in={ids}"))
+    assert "POSTCOMPILE" in str(large)
+    assert names(session, large) == ["Alice"]
+
+    policy.IN_LIST_LARGE_STRATEGY = "literal"
+    small = f.filter(parsed=parser.parse("id__in=1,2"))
+    large = f.filter(parsed=parser.parse(f"id__in={ids}"))
+    assert names(session, small) == ["Alice", "Bob"]
+    assert names(session, large) == ["Alice"]
+    assert len(large.compile().params) == 1
+
+    query, params = f.filter_with_params(parsed=parser.parse(f"id__in={ids}"))
+    assert list(query.compile().params) == ["id_in_0"]
+    assert names(session, (query, params)) == ["Alice"]
+
+    policy.IN_LIST_LARGE_STRATEGY = "array"
+    query, _ = f.filter_with_params(parsed=parser.parse(f"id__in={ids}"))
+    compiled = query.compile(dialect=postgresql.dialect())
+    assert "= ANY (" in str(compiled)
+    assert list(compiled.params) == ["id_in_0"]
+
+
+def test_async_helpers(parser, policy):
+    import asyncio
+
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.pool import StaticPool
+
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with AsyncSession(engine) as session:
+            session.add_all([Parent(name=f"P{i}") for i in range(5)])
+            session.add_all([Event(flag=i % 2 == 0) for i in range(3)])
+            await session.commit()
+
+            f = OrmParamsFilter(policy, model=Parent)
+            parsed = parser.parse("id__gt=1")
+            everything = await f.fetch_all(session, parsed=parsed)
+            page = await f.fetch_page(session, limit=2, offset=1, parsed=parsed)
+            streamed = [p async for p in f.stream(session, yield_per=2, parsed=parsed)]
+
+            events = OrmParamsFilter(policy, model=Event)
+            flagged = parser.parse("flag=true")
+            typed = [
+                [e.id for e in await events.fetch_all(session, parsed=flagged)],
+                [e.id for e in await events.fetch_page(session, 1, parsed=flagged)],
+                [e.id async for e in events.stream(session, parsed=flagged)],
+            ]
+
+        await engine.dispose()
+        return everything, page, streamed, typed
+
+    everything, page, streamed, typed = asyncio.run(run())
+    assert typed == [[1, 3], [1], [1, 3]]
+    assert [p.name for p in everything] == ["P1", "P2", "P3", "P4"]
+    assert [p.name for p in page] == ["P2", "P3"]
+    assert [p.name for p in streamed] == ["P1", "P2", "P3", "P4"]
+
+
+def test_async_helpers_eager_load_collections(parser, policy):
+    import asyncio
+
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.pool import StaticPool
+
+    policy.EAGER_LOADING = True
+    kwargs = dict(
+        parsed=parser.parse("children.value__startswith=C"),
+        allowed_relationships=["children"],
+    )
+
+    def loaded(parents):
+        return [(p.name, sorted(c.value for c in p.children)) for p in parents]
+
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with AsyncSession(engine) as session:
+            alice, bob = Parent(name="Alice"), Parent(name="Bob")
+            session.add_all(
+                [
+                    Child(value="C1", parent=alice),
+                    Child(value="C2", parent=alice),
+                    Child(value="C3", parent=bob),
+                ]
+            )
+            await session.commit()
+            session.expunge_all()
+
+            f = OrmParamsFilter(policy, model=Parent)
+            everything = loaded(await f.fetch_all(session, **kwargs))
+            page = loaded(await f.fetch_page(session, limit=1, **kwargs))
+            streamed = loaded([p async for p in f.stream(session, **kwargs)])
+
+        await engine.dispose()
+        return everything, page, streamed
+
+    everything, page, streamed = asyncio.run(run())
+    assert everything == [("Alice", ["C1", "C2"]), ("Bob", ["C3"])]
+    assert page == [("Alice", ["C1", "C2"])]
+    assert dict(streamed) == dict(everything)
+
+
+def test_eager_loading_with_limit_loads_full_collections(session, policy, parser):
+    policy.EAGER_LOADING = True
+    query = OrmParamsFilter(policy, model=Parent).filter(
+        parsed=parser.parse("children.value__startswith=C&_limit=1"),
+        allowed_relationships=["children"],
+    )
+
+    parent = session.execute(query).unique().scalars().one()
+    assert sorted(c.value for c in parent.children) == ["C1", "C2"]
+
+
+def test_keyset_pagination_walks_all_pages(session, policy, parser):
+    session.add_all([Parent(name=name) for name in ("Carl", "Bob", "Dan")])
+    session.commit()
+
+    f = OrmParamsFilter(policy, model=Parent)
+    pages, after = [], None
+    while True:
+        qs = "_sort=-name&_limit=2" + (f"&_after={after}" if after else "")
+        parsed = parser.parse(qs)
+        rows = session.execute(f.filter(parsed=parsed)).scalars().all()
+        pages.append([(p.name, p.id) for p in rows])
+        after = f.next_cursor(rows, parsed=parsed)
+        if after is None:
+            break
+
+    assert pages == [
+        [("Dan", 5), ("Carl", 3)],
+        [("Bob", 2), ("Bob", 4)],
+        [("Alice", 1)],
+    ]
+
+
+def test_keyset_pagination_on_boolean_column(session, policy, parser):
+    session.add_all([Event(flag=flag) for flag in (False, True, True)])
+    session.commit()
+
+    f = OrmParamsFilter(policy, model=Event)
+    pages, after = [], None
+    while True:
+        qs = "_sort=-flag&_limit=1" + (f"&_after={after}" if after else "")
+        parsed = parser.parse(qs)
+        rows = session.execute(f.filter(parsed=parsed)).scalars().all()
+        pages.append([(e.flag, e.id) for e in rows])
+        after = f.next_cursor(rows, parsed=parsed)
+        if after is None:
+            break
+
+    assert pages == [[(True, 2)], [(True, 3)], [(False, 1)], []]
+
+
+def test_pagination_rejects_bad_input(policy, parser, monkeypatch):
+    from ormparams.core.access import clear_access_indexes
+    from ormparams.core.exceptions import ExcludedFieldError, InvalidValueError
+    from ormparams.core.pagination import encode_cursor
+
+    f = OrmParamsFilter(policy, model=Parent)
+    with pytest.raises(InvalidValueError):
+        parser.parse("_limit=0")
+    with pytest.raises(InvalidValueError):
+        f.filter(parsed=parser.parse("_sort=name&_after=bm90LWpzb24"))
+    nested = encode_cursor(["name", "id"], [{"x": 1}, [1]])
+    with pytest.raises(InvalidValueError):
+        f.filter(parsed=parser.parse(f"_sort=name&_after={nested}"))
+    null = encode_cursor(["id"], [None])
+    with pytest.raises(InvalidValueError):
+        f.filter(parsed=parser.parse(f"_limit=1&_after={null}"))
+
+    monkeypatch.setattr(Parent, "ORMP_EXCLUDED_FIELDS", ["name"])
+    clear_access_indexes()
+    with pytest.raises(ExcludedFieldError):
+        f.filter(parsed=parser.parse("_sort=name"))
+    clear_access_indexes()
+
+    policy.MAX_LIMIT = 10
+    assert parser.parse("_limit=500&name=x").limit == 10
+
+
+def test_sort_param_and_index_requirement(session, policy, parser, caplog):
+    from ormparams.core.exceptions import UnindexedSortError
+
+    session.add(Parent(name="Aaron"))
+    session.commit()
+    f = OrmParamsFilter(policy, model=Parent)
+
+    query = f.filter(parsed=parser.parse("_sort=-name"))
+    assert [p.name for p in session.execute(query).scalars()] == [
+        "Bob",
+        "Alice",
+        "Aaron",
+    ]
+
+    policy.SORT_REQUIRES_INDEX = True
+    with pytest.raises(UnindexedSortError):
+        f.filter(parsed=parser.parse("_sort=-name"))
+
+    policy.UNINDEXED_SORT = "warn"
+    query = f.filter(parsed=parser.parse("_sort=-name,-id"))
+    assert [p.id for p in session.execute(query).scalars()] == [3, 2, 1]
+    assert "not indexed" in caplog.text
+
+
+def test_count_query_uses_exists_and_ignores_paging(session, policy, parser):
+    from sqlalchemy import select
+
+    f = OrmParamsFilter(policy, model=Parent)
+    parsed = parser.parse("children.value__startswith=C&_sort=-name&_limit=1")
+    kwargs = dict(parsed=parsed, allowed_relationships=["children"])
+
+    joined = f.filter(**kwargs).limit(None)
+    assert len(session.execute(joined).all()) == 3
+
+    stmt = f.count_query(**kwargs)
+    sql = str(stmt)
+    assert "EXISTS" in sql and "JOIN" not in sql and "ORDER BY" not in sql
+    assert session.execute(stmt).scalar_one() == 2
+
+    wrapped = f.count_query(query=select(Parent).order_by(Parent.name), **kwargs)
+    assert "ORDER BY" not in str(wrapped)
+    assert session.execute(wrapped).scalar_one() == 2
+
+    policy.COUNT_ESTIMATE_THRESHOLD = 1
+    assert f.count(session, **kwargs) == 2
+
+
+def test_planner_rows_reads_aggregate_input():
+    from ormparams.core.counting import planner_rows
+
+    plan = {
+        "Plan": {
+            "Node Type": "Aggregate",
+            "Plan Rows": 1,
+            "Plans": [{"Node Type": "Seq Scan", "Plan Rows": 120000}],
+        }
+    }
+    assert planner_rows(plan) == 120000
+
+
+def test_fields_param_loads_only_requested_columns(session, policy, parser):
+    from sqlalchemy import inspect
+
+    from ormparams.core.exceptions import NotAllowedRelationshioError
+
+    f = OrmParamsFilter(policy, model=Child)
+    parsed = parser.parse("_fields=value,parent.name&value=C1")
+    assert parsed.fields == (((), "value"), (("parent",), "name"))
+
+    query = f.filter(parsed=parsed, allowed_relationships=["parent"])
+    assert "children.parent_id" not in str(query)
+    child = session.execute(query).scalars().one()
+    assert inspect(child).unloaded == {"parent_id", "parent"}
+    assert child.parent.name == "Alice"
+
+    with pytest.raises(NotAllowedRelationshioError):
+        f.filter(parsed=parser.parse("_fields=parent.name"))
+
+
+def test_eager_loading_of_joined_and_included_relationships(
+    session, policy, parser, monkeypatch
+):
+    from sqlalchemy import inspect
+
+    policy.EAGER_LOADING = True
+    f = OrmParamsFilter(policy, model=Parent)
+    kwargs = dict(parsed=parser.parse("children.value=C1"))
+    kwargs["allowed_relationships"] = ["children"]
+
+    parent = session.execute(f.filter(**kwargs)).unique().scalars().one()
+    assert "children" not in inspect(parent).unloaded
+    assert [c.value for c in parent.children] == ["C1"]
+    session.expunge_all()
+
+    monkeypatch.setattr(Parent, "ORMP_EAGER_LOADING", {"children": "selectin"})
+    parent = session.execute(f.filter(**kwargs)).unique().scalars().one()
+    assert [c.value for c in parent.children] == ["C1", "C2"]
+    session.expunge_all()
+
+    children = OrmParamsFilter(policy, model=Child).filter(
+        parsed=parser.parse("_include=parent&value__startswith=C"),
+        allowed_relationships=["parent"],
+    )
+    assert all(
+        "parent" not in inspect(c).unloaded for c in session.execute(children).scalars()
+    )
+
+
+def test_instrumentation_records_every_phase(session):
+    from ormparams.core.instrumentation import HistogramCollector
+
+    collector = HistogramCollector()
+    policy = OrmParamsPolicy(INSTRUMENTATION=collector)
+    parser = OrmParamsParser(policy)
+    f = OrmParamsFilter(policy, model=Parent)
+
+    for _ in range(3):
+        parsed = parser.parse("name__startswith=A&id__in=1,2,3&children.value=C1")
+        f.filter(parsed=parsed, allowed_relationships=["children"])
+
+    stats = collector.snapshot()
+    assert set(stats) == {"parse", "plan", "authorize", "join", "serialize", "build"}
+    assert all(phase["calls"] == 3 for phase in stats.values())
+    assert stats["parse"]["counts"]["params"] == 9
+    assert stats["plan"]["counts"] == {"cache_miss": 1}
+    assert stats["join"]["max_counts"]["joins"] == 1
+    assert stats["serialize"]["max_counts"]["in_list_max"] == 3
+    assert stats["serialize"]["max_counts"]["serializers"] == 1
+    assert 0 < collector.percentile("build", 0.5) <= stats["build"]["max"]
+
+
+def test_aggregate_reaction_counts_without_raising(session, policy, parser, caplog):
+    policy.EXCLUDED_OPERATOR = "aggregate"
+    violations = policy.EXCEPTION_WRAPPER.violations
+    f = OrmParamsFilter(policy, model=Parent)
+
+    for _ in range(3):
+        query = f.filter(
+            parsed=parser.parse("children.value__endswith=1&children.value=C3"),
+            allowed_relationships=["children"],
+        )
+        assert names(session, query) == ["Bob"]
+
+    assert violations.counts() == {("value", "endswith", "excluded_operator"): 3}
+    assert caplog.text == ""
+
+    violations.interval = 0
+    f.filter(
+        parsed=parser.parse("children.value__endswith=1"),
+        allowed_relationships=["children"],
+    )
+    assert "4 policy violations" in caplog.text
+    assert OrmParamsPolicy().EXCEPTION_WRAPPER.violations.counts() == {}
+
+
+def test_query_budget_rejects_before_building(session):
+    from ormparams.core.budget import QueryBudget
+    from ormparams.core.exceptions import QueryBudgetExceededError
+
+    budget = QueryBudget(max_params=3, max_depth=1, max_in_size=2, max_cost=6)
+    policy = OrmParamsPolicy(BUDGET=budget)
+    parser = OrmParamsParser(policy)
+    f = OrmParamsFilter(policy, model=Parent)
+
+    with pytest.raises(QueryBudgetExceededError, match="more than 3 params"):
+        parser.parse("id=1&id=2&id=3&id=4")
+    with pytest.raises(QueryBudgetExceededError, match="depth 2"):
+        parser.parse("children.parent.name=Alice")
+    with pytest.raises(QueryBudgetExceededError, match="cost 10"):
+        f.filter(parsed=parser.parse("name__contains=A&name__endswith=e"))
+    assert policy.PLAN_CACHE.info().currsize == 0
+    with pytest.raises(QueryBudgetExceededError, match="3 items"):
+        f.filter(parsed=parser.parse("id__in=1,2,3"))
+
+    unchecked = OrmParamsParser(OrmParamsPolicy()).parse("children.parent.name=A")
+    with pytest.raises(QueryBudgetExceededError, match="depth 2"):
+        f.filter(parsed=unchecked, allowed_relationships=["children", "parent"])
+
+    query = f.filter(parsed=parser.parse("name__startswith=A&id__in=1,2"))
+    assert names(session, query) == ["Alice"]
+
+
+def test_unindexed_operators_are_gated_per_policy_and_filter(session, policy, parser):
+    from ormparams.core.exceptions import UnindexedOperatorError
+
+    parsed = parser.parse("name__contains=li&id__gt=1")
+    assert (
+        names(session, OrmParamsFilter(policy, model=Parent).filter(parsed=parsed))
+        == []
+    )
+
+    policy.OPERATORS_REQUIRE_INDEX = True
+    with pytest.raises(UnindexedOperatorError):
+        OrmParamsFilter(policy, model=Parent).filter(parsed=parsed)
+    OrmParamsFilter(policy, model=Parent).filter(parsed=parser.parse("id__gt=1"))
+
+    lenient = OrmParamsFilter(policy, model=Parent, unindexed_operator="ignore")
+    assert names(session, lenient.filter(parsed=parser.parse("name__contains=li"))) == [
+        "Alice"
+    ]
+
+    report = lenient.unindexed_report()
+    assert ("name", "exact") in report and ("name", "contains") in report
+    assert ("id", "contains") in report and ("id", "exact") not in report
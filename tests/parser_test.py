@@ -8,3 +8,40 @@ policy = OrmParamsPolicy()
 parser = OrmParamsParser(policy)
 
 pprint(parser.parse("hello__a=v&hello__b=v&a.b.hello__a__b=v"))
+
+
+def test_parse_decodes_like_parse_qsl():
+    parsed = parser.parse("name__in=a%2Cb&title=hello+world&empty=&flag")
+
+    assert list(parsed) == ["name", "title"]
+    assert parsed["name"].params[0].value == "a,b"
+    assert parsed["name"].params[0].operators == ["in"]
+    assert parsed["title"].params[0].value == "hello world"
+
+
+def test_parse_dict_does_not_reencode_values():
+    parsed = parser.parse_dict({"parent.name__startswith": "a&b=%20"})
+
+    param = parsed["name"].params[0]
+    assert param.value == "a&b=%20"
+    assert param.relationships == ["parent"]
+    assert param.operators == ["startswith"]
+
+
+def test_parse_items_keeps_repeated_keys():
+    parsed = parser.parse_items([("age__ge", "18"), ("age__ge", "21")])
+
+    assert [p.value for p in parsed["age"].params] == ["18", "21"]
+
+
+def test_key_shapes_are_memoized_with_bounded_cache():
+    small = OrmParamsParser(OrmParamsPolicy(KEY_CACHE_SIZE=2))
+
+    small.parse("parent.name__startswith=a&age=1")
+    small.parse("parent.name__startswith=b&age=2")
+    small.parse("id=3")
+
+    info = small.policy.KEY_CACHE.info()
+    assert (info.hits, info.misses, info.currsize) == (2, 3, 2)
+    assert "parent.name__startswith" not in small.policy.KEY_CACHE
+    assert small.policy.KEY_CACHE.get("id") == ((), "id", ("exact",))